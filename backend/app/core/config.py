@@ -2,15 +2,9 @@
 Core configuration and settings for the IAM Generator API.
 """
 
-import sys
-from pathlib import Path
+import os
 from typing import List
 
-# Add the iam_generator package to the path  
-PROJECT_ROOT = Path(__file__).parent.parent.parent
-BACKEND_PATH = PROJECT_ROOT
-sys.path.append(str(BACKEND_PATH))
-
 # API Configuration
 API_TITLE = "AWS IAM Generator API"
 API_VERSION = "1.0.0"
@@ -39,6 +33,31 @@ CORS_ORIGINS = [
 DEBUG = False
 LOG_LEVEL = "info"
 
+# Uvicorn worker processes: WORKERS, then WEB_CONCURRENCY, then one per CPU.
+# docker-entrypoint.sh, the Dockerfile and app.main pass uvicorn the same
+# value, so the analyzer pool below is sized for the workers actually started.
+WEB_WORKERS = int(os.environ.get("WORKERS") or os.environ.get("WEB_CONCURRENCY")
+                  or os.cpu_count() or 1)
+
+# Worker processes used for CPU-bound analyzer calls. Every web worker has its
+# own pool, so by default the CPUs are shared out between them rather than
+# each web worker starting one analyzer process per CPU
+EXECUTOR_MAX_WORKERS = int(os.environ.get(
+    "IAM_GENERATOR_EXECUTOR_WORKERS",
+    max(1, (os.cpu_count() or 1) // max(1, WEB_WORKERS))
+))
+
+# Analyzer results memoized per worker, keyed by command text
+ANALYSIS_CACHE_SIZE = 4096
+
+# Window and size for coalescing concurrent analysis requests
+BATCH_WINDOW_SECONDS = 0.005
+BATCH_MAX_SIZE = 64
+
+# How long the /services payload is served from memory before it is rebuilt
+# (auto-discovery can add services at runtime)
+SERVICES_CACHE_SECONDS = 300
+
 # Default AWS Configuration
 DEFAULT_ACCOUNT_ID = "123456789012"
 DEFAULT_REGION = "us-east-1"
@@ -0,0 +1,35 @@
+"""
+Response classes for the IAM Generator API.
+"""
+
+from typing import Any, Dict, Type
+
+import pydantic_core
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered by pydantic-core's Rust serializer.
+    
+    Produces the same compact UTF-8 output as JSONResponse (NaN/Infinity
+    become null) but serializes large policy documents several times faster.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content)
+
+
+def model_response(model: Type[BaseModel], data: Dict[str, Any]) -> Response:
+    """
+    Validate data against a response model once and return it as JSON.
+    
+    Returning a Response directly skips FastAPI's second validation and
+    re-encoding pass for the route's response_model, which still documents
+    the schema. Unknown keys are dropped as before.
+    """
+    return Response(
+        content=model.model_validate(data).model_dump_json(),
+        media_type="application/json"
+    )
@@ -7,14 +7,17 @@ This serves as a bridge between the React frontend and the CLI tool.
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from .core.config import API_TITLE, API_VERSION, API_DESCRIPTION, CORS_ORIGINS
+from .core.config import API_TITLE, API_VERSION, API_DESCRIPTION, CORS_ORIGINS, WEB_WORKERS
+from .core.responses import FastJSONResponse
 from .routers import health, analysis, roles, advanced
+from .services import ANALYZE_COALESCER, BATCH_ANALYZE_COALESCER, EXECUTOR
 
 # Create FastAPI app
 app = FastAPI(
     title=API_TITLE,
     version=API_VERSION,
-    description=API_DESCRIPTION
+    description=API_DESCRIPTION,
+    default_response_class=FastJSONResponse
 )
 
 # Add CORS middleware to allow frontend requests
@@ -33,6 +36,23 @@ app.include_router(roles.router, tags=["Roles"])
 app.include_router(advanced.router, tags=["Advanced"])
 
 
+@app.on_event("shutdown")
+async def shutdown_executor():
+    """Stop request coalescing and the analyzer worker processes."""
+    await ANALYZE_COALESCER.stop()
+    await BATCH_ANALYZE_COALESCER.stop()
+    EXECUTOR.shutdown(wait=False, cancel_futures=True)
+
+
 if __name__ == "__main__":
+    import os
     import uvicorn
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
+    
+    # Same switch as docker-entrypoint.sh: the reloader's file watcher is for
+    # development only. uvicorn picks uvloop/httptools itself when installed.
+    if os.environ.get("RELOAD") == "true":
+        # A single server process; the reloaded app sizes its pool from this
+        os.environ["WORKERS"] = "1"
+        uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
+    else:
+        uvicorn.run("app.main:app", host="0.0.0.0", port=8000, workers=WEB_WORKERS)
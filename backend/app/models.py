@@ -3,10 +3,21 @@ Pydantic models for API request/response schemas.
 """
 
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
-class AnalysisRequest(BaseModel):
+class RequestModel(BaseModel):
+    """Base for request bodies: unknown fields are ignored and bodies are read-only."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+
+# Response payloads come straight from the analyzer, so nested structures
+# such as permissions and policy documents stay Dict[str, Any]: pydantic
+# passes Any through without per-key validation, which measured faster
+# than typed sub-models when validating analyzer output.
+
+
+class AnalysisRequest(RequestModel):
     """Request model for command analysis."""
     command: str
     debug: bool = False
@@ -23,7 +34,7 @@ class AnalysisResponse(BaseModel):
     warnings: List[str]
 
 
-class RoleGenerationRequest(BaseModel):
+class RoleGenerationRequest(RequestModel):
     """Request model for IAM role generation."""
     command: str
     role_name: str
@@ -44,7 +55,7 @@ class RoleConfigResponse(BaseModel):
     aws_cli_commands: Optional[List[str]] = None
 
 
-class BatchAnalysisRequest(BaseModel):
+class BatchAnalysisRequest(RequestModel):
     """Request model for batch command analysis."""
     commands: List[str]
     debug: bool = False
@@ -57,7 +68,7 @@ class BatchAnalysisResponse(BaseModel):
     combined_policy: Dict[str, Any]
 
 
-class ResourceSpecificRequest(BaseModel):
+class ResourceSpecificRequest(RequestModel):
     """Request model for resource-specific analysis."""
     commands: List[str]
     account_id: Optional[str] = None
@@ -74,7 +85,7 @@ class ResourceSpecificResponse(BaseModel):
     specific_resources_found: int
 
 
-class LeastPrivilegeRequest(BaseModel):
+class LeastPrivilegeRequest(RequestModel):
     """Request model for least privilege analysis."""
     commands: List[str]
     account_id: Optional[str] = None
@@ -82,7 +93,7 @@ class LeastPrivilegeRequest(BaseModel):
     debug: bool = False
 
 
-class ServiceSummaryRequest(BaseModel):
+class ServiceSummaryRequest(RequestModel):
     """Request model for service usage summary."""
     commands: List[str]
     debug: bool = False
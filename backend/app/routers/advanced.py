@@ -4,6 +4,9 @@ Advanced analysis endpoints for resource-specific and least privilege policies.
 
 from fastapi import APIRouter, HTTPException
 
+from iam_generator.parser import AWSCLIParser
+
+from ..core.responses import FastJSONResponse, model_response
 from ..models import (
     ResourceSpecificRequest,
     ResourceSpecificResponse,
@@ -11,19 +14,26 @@ from ..models import (
     ServiceSummaryRequest,
     ServiceSummaryResponse
 )
-from ..services import IAMGeneratorService
+from ..services import (
+    run_in_executor,
+    run_resource_specific_policy,
+    run_least_privilege_policy,
+    run_service_summary
+)
 
 router = APIRouter()
-service = IAMGeneratorService()
 
 
 @router.post("/analyze-resource-specific", response_model=ResourceSpecificResponse)
 async def analyze_resource_specific(request: ResourceSpecificRequest):
     """Generate IAM policy with resource-specific ARNs instead of wildcards."""
     try:
+        commands = AWSCLIParser.normalize_commands(request.commands)
+        
         # Use the analyzer's resource-specific policy generation
-        result = service.analyzer.generate_resource_specific_policy(
-            commands=request.commands,
+        result = await run_in_executor(
+            run_resource_specific_policy,
+            commands=commands,
             account_id=request.account_id,
             region=request.region,
             strict_mode=request.strict_mode if request.strict_mode is not None else True
@@ -33,12 +43,12 @@ async def analyze_resource_specific(request: ResourceSpecificRequest):
         metadata = result.get("_metadata", {})
         
         # Return the response with the expected structure
-        return ResourceSpecificResponse(
-            policy_document=result,
-            metadata=metadata,
-            commands_analyzed=metadata.get("commands_analyzed", len(request.commands)),
-            specific_resources_found=metadata.get("specific_resources_found", 0)
-        )
+        return model_response(ResourceSpecificResponse, {
+            "policy_document": result,
+            "metadata": metadata,
+            "commands_analyzed": metadata.get("commands_analyzed", len(commands)),
+            "specific_resources_found": metadata.get("specific_resources_found", 0)
+        })
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -48,14 +58,15 @@ async def analyze_least_privilege(request: LeastPrivilegeRequest):
     """Generate a least-privilege IAM policy for the given commands."""
     try:
         # Use the analyzer's least privilege policy generation
-        policy_document = service.analyzer.generate_least_privilege_policy(
-            commands=request.commands,
+        policy_document = await run_in_executor(
+            run_least_privilege_policy,
+            commands=AWSCLIParser.normalize_commands(request.commands),
             account_id=request.account_id,
             region=request.region
         )
         
-        result = {"policy_document": policy_document}
-        return result
+        # No response model here, so skip jsonable_encoder and render directly
+        return FastJSONResponse({"policy_document": policy_document})
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -64,8 +75,10 @@ async def analyze_least_privilege(request: LeastPrivilegeRequest):
 async def get_service_summary(request: ServiceSummaryRequest):
     """Generate a summary of service usage and permissions."""
     try:
+        commands = AWSCLIParser.normalize_commands(request.commands)
+        
         # Use the analyzer's service summary generation
-        summary = service.analyzer.get_service_summary(request.commands)
+        summary = await run_in_executor(run_service_summary, commands)
         
         # Calculate totals
         total_services = len(summary)
@@ -78,11 +91,11 @@ async def get_service_summary(request: ServiceSummaryRequest):
         result = {
             "summary": summary,
             "total_services": total_services,
-            "total_commands": len(request.commands),
+            "total_commands": len(commands),
             "total_actions": total_actions,
             "unique_permissions": total_permissions,
             "policy_document": policy_document
         }
-        return ServiceSummaryResponse(**result)
+        return model_response(ServiceSummaryResponse, result)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
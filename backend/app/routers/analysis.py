@@ -2,9 +2,19 @@
 Command analysis endpoints.
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import List
+import asyncio
+import hashlib
+import time
 
+import pydantic_core
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from typing import List, Optional, Tuple
+
+from iam_generator.parser import AWSCLIParser
+
+from ..core.config import SERVICES_CACHE_SECONDS
+from ..core.responses import model_response
 from ..models import (
     AnalysisRequest, 
     AnalysisResponse,
@@ -12,18 +22,27 @@ from ..models import (
     BatchAnalysisResponse,
     ServicesResponse
 )
-from ..services import IAMGeneratorService
+from ..services import (
+    ANALYZE_COALESCER,
+    BATCH_ANALYZE_COALESCER,
+    IAMGeneratorService,
+    run_in_executor,
+    run_combined_policy,
+    run_supported_services
+)
 
 router = APIRouter()
-service = IAMGeneratorService()
+
+# (expires_at, etag, payload) for the /services response
+_services_cache: Optional[Tuple[float, str, bytes]] = None
 
 
 @router.post("/analyze", response_model=AnalysisResponse)
 async def analyze_command(request: AnalysisRequest):
     """Analyze a single AWS CLI command and return required permissions."""
     try:
-        result = service.analyze_command(request.command, request.debug)
-        return AnalysisResponse(**result)
+        result = await ANALYZE_COALESCER.submit((request.command, request.debug))
+        return model_response(AnalysisResponse, result)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -32,20 +51,74 @@ async def analyze_command(request: AnalysisRequest):
 async def batch_analyze_commands(request: BatchAnalysisRequest):
     """Analyze multiple AWS CLI commands and return combined results."""
     try:
-        result = service.batch_analyze(request.commands, request.debug)
-        return BatchAnalysisResponse(**result)
+        commands = tuple(AWSCLIParser.normalize_commands(request.commands))
+        result = await BATCH_ANALYZE_COALESCER.submit((commands, request.debug))
+        return model_response(BatchAnalysisResponse, result)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/batch-analyze/stream")
+async def stream_batch_analyze_commands(request: BatchAnalysisRequest):
+    """
+    Analyze multiple AWS CLI commands and stream the results as NDJSON.
+    
+    Each command's result is sent as one line as soon as it is ready (in
+    request order), followed by a final line holding the summary and the
+    combined policy.
+    """
+    commands = AWSCLIParser.normalize_commands(request.commands)
+    debug = request.debug
+    
+    # Start every analysis up front; the coalescer spreads them over workers
+    pending = [asyncio.ensure_future(ANALYZE_COALESCER.submit((command, debug)))
+               for command in commands]
+    combined_policy = asyncio.ensure_future(run_in_executor(run_combined_policy, commands, debug))
+    
+    async def stream():
+        results = []
+        try:
+            for command, task in zip(commands, pending):
+                try:
+                    result = await task
+                except Exception as e:
+                    result = IAMGeneratorService.failed_analysis(command, str(e))
+                result = IAMGeneratorService.batch_entry(result)
+                results.append(result)
+                yield pydantic_core.to_json(result) + b"\n"
+            
+            yield pydantic_core.to_json({
+                'summary': IAMGeneratorService.generate_batch_summary(results),
+                'combined_policy': await combined_policy
+            }) + b"\n"
+        finally:
+            # Stop outstanding work if the client goes away mid-stream
+            for task in pending + [combined_policy]:
+                task.cancel()
+    
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
 @router.get("/services", response_model=ServicesResponse)
-async def get_supported_services():
+async def get_supported_services(request: Request):
     """Get list of supported AWS services."""
+    global _services_cache
     try:
-        services = service.get_supported_services()
-        return ServicesResponse(
-            services=services,
-            total_count=len(services)
-        )
+        if _services_cache is None or _services_cache[0] <= time.monotonic():
+            services = await run_in_executor(run_supported_services)
+            payload = ServicesResponse(
+                services=services,
+                total_count=len(services)
+            ).model_dump_json().encode()
+            etag = '"%s"' % hashlib.blake2b(payload, digest_size=16).hexdigest()
+            _services_cache = (time.monotonic() + SERVICES_CACHE_SECONDS, etag, payload)
+        
+        _, etag, payload = _services_cache
+        headers = {"ETag": etag}
+        if_none_match = request.headers.get("if-none-match", "")
+        if etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers=headers)
+        
+        return Response(content=payload, media_type="application/json", headers=headers)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -4,21 +4,22 @@ IAM role generation endpoints.
 
 from fastapi import APIRouter, HTTPException
 
+from ..core.responses import model_response
 from ..models import (
     RoleGenerationRequest,
     RoleConfigResponse
 )
-from ..services import IAMGeneratorService
+from ..services import run_in_executor, run_generate_role
 
 router = APIRouter()
-service = IAMGeneratorService()
 
 
 @router.post("/generate-role", response_model=RoleConfigResponse)
 async def generate_iam_role(request: RoleGenerationRequest):
     """Generate an IAM role configuration for the given command."""
     try:
-        result = service.generate_role(
+        result = await run_in_executor(
+            run_generate_role,
             command=request.command,
             role_name=request.role_name,
             trust_policy=request.trust_policy,
@@ -31,6 +32,6 @@ async def generate_iam_role(request: RoleGenerationRequest):
         if 'error' in result:
             raise HTTPException(status_code=400, detail=result['error'])
             
-        return RoleConfigResponse(**result)
+        return model_response(RoleConfigResponse, result)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -2,23 +2,54 @@
 Business logic services for the IAM Generator API.
 """
 
+import asyncio
+import contextlib
+import functools
 import json
+import multiprocessing
 import subprocess
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Hashable, List, Dict, Any, Optional, Set, Tuple
 
-from iam_generator.analyzer import IAMPermissionAnalyzer
 from iam_generator.role_generator import IAMRoleGenerator
 from iam_generator.parser import AWSCLIParser
 
+from .core.config import (
+    ANALYSIS_CACHE_SIZE,
+    BATCH_MAX_SIZE,
+    BATCH_WINDOW_SECONDS,
+    EXECUTOR_MAX_WORKERS
+)
+
+# Analyzer work is CPU-bound, so handlers hand it to worker processes instead
+# of running it on the event loop. Only the workers build a service and
+# analyzer; they are spawned rather than forked so each starts from a clean
+# interpreter instead of inheriting the web server's threads and locks.
+EXECUTOR = ProcessPoolExecutor(
+    max_workers=EXECUTOR_MAX_WORKERS,
+    mp_context=multiprocessing.get_context("spawn")
+)
+
+# Per-worker service, built on the first task a worker process receives
+_worker_service: Optional["IAMGeneratorService"] = None
+
 
 class IAMGeneratorService:
     """Service class that encapsulates the core IAM generation logic."""
     
     def __init__(self):
         """Initialize the service with core components."""
-        self.analyzer = IAMPermissionAnalyzer()
+        # Reuse the role generator's process-wide analyzer rather than
+        # loading the permissions database a second time
         self.role_generator = IAMRoleGenerator()
+        self.analyzer = self.role_generator.analyzer
         self.parser = AWSCLIParser()
+        
+        # LRU of analyzer results keyed by (stripped command, debug); entries
+        # are shared between requests and must not be mutated
+        self._analysis_cache: OrderedDict = OrderedDict()
+        self._analysis_cache_size = ANALYSIS_CACHE_SIZE
     
     def analyze_command(self, command: str, debug: bool = False) -> Dict[str, Any]:
         """
@@ -32,8 +63,7 @@ class IAMGeneratorService:
             Dictionary containing analysis results
         """
         try:
-            # Use the analyzer's analyze_command method directly
-            result = self.analyzer.analyze_command(command)
+            result = self._cached_analyze(command, debug)
             
             return {
                 'service': result['service'],
@@ -47,15 +77,20 @@ class IAMGeneratorService:
         except Exception as e:
             if debug:
                 raise
-            return {
-                'service': 'unknown',
-                'action': 'unknown',
-                'original_command': command,
-                'required_permissions': [],
-                'policy_document': {},
-                'resource_arns': [],
-                'warnings': [str(e)]
-            }
+            return self.failed_analysis(command, str(e))
+    
+    @staticmethod
+    def failed_analysis(command: str, message: str) -> Dict[str, Any]:
+        """Build the analysis result reported for a command that failed."""
+        return {
+            'service': 'unknown',
+            'action': 'unknown',
+            'original_command': command,
+            'required_permissions': [],
+            'policy_document': {},
+            'resource_arns': [],
+            'warnings': [message]
+        }
     
     def generate_role(self, 
                      command: str, 
@@ -121,19 +156,13 @@ class IAMGeneratorService:
         Returns:
             Dictionary containing batch analysis results
         """
-        results = []
-        all_permissions = []
-        
-        for command in commands:
-            result = self.analyze_command(command, debug)
-            results.append(result)
-            all_permissions.extend(result['required_permissions'])
+        results = [self.batch_entry(self.analyze_command(command, debug)) for command in commands]
         
         # Use the analyzer's analyze_commands method for better integration
-        analysis_result = self.analyzer.analyze_commands(commands)
+        analysis_result = self.analyzer.analyze_commands(commands, debug=debug)
         
         # Generate summary
-        summary = self._generate_batch_summary(results)
+        summary = self.generate_batch_summary(results)
         
         return {
             'results': results,
@@ -141,6 +170,33 @@ class IAMGeneratorService:
             'combined_policy': analysis_result.policy_document
         }
     
+    @staticmethod
+    def batch_entry(result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Trim a single-command analysis for inclusion in a batch response.
+        
+        The per-command policy document is dropped because the batch's
+        combined policy already covers every command; repeating it made the
+        payload grow with the number of commands times the policy size.
+        Warnings stay with the command that raised them.
+        """
+        return {key: value for key, value in result.items() if key != 'policy_document'}
+    
+    def _cached_analyze(self, command: str, debug: bool) -> Dict[str, Any]:
+        """Run the analyzer for a command, reusing results for repeated commands."""
+        key = (command.strip(), debug)
+        cache = self._analysis_cache
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+            return result
+        
+        result = self.analyzer.analyze_command(key[0], debug=debug)
+        cache[key] = result
+        if len(cache) > self._analysis_cache_size:
+            cache.popitem(last=False)
+        return result
+    
     def get_supported_services(self) -> List[str]:
         """
         Get list of supported AWS services.
@@ -158,7 +214,8 @@ class IAMGeneratorService:
                 arns.add(perm['resource'])
         return list(arns)
     
-    def _generate_batch_summary(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    @staticmethod
+    def generate_batch_summary(results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate summary statistics for batch analysis."""
         services = set()
         actions = set()
@@ -186,3 +243,174 @@ class IAMGeneratorService:
         """Generate CloudFormation configuration for the role."""
         # Placeholder for CloudFormation generation
         return f"# CloudFormation configuration for {role_config['role_name']}"
+
+
+def _get_worker_service() -> IAMGeneratorService:
+    """Return the service cached in the current worker process."""
+    global _worker_service
+    if _worker_service is None:
+        _worker_service = IAMGeneratorService()
+    return _worker_service
+
+
+async def run_in_executor(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a worker helper in the process pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(EXECUTOR, functools.partial(func, *args, **kwargs))
+
+
+def _result_or_exception(func: Callable[..., Any], *args: Any) -> Any:
+    """Call func, returning the exception instead of raising it."""
+    try:
+        return func(*args)
+    except Exception as e:
+        return e
+
+
+def run_analyze_many(items: List[Tuple[str, bool]]) -> List[Any]:
+    """Worker helper for IAMGeneratorService.analyze_command over (command, debug) items."""
+    service = _get_worker_service()
+    return [_result_or_exception(service.analyze_command, command, debug)
+            for command, debug in items]
+
+
+def run_generate_role(**kwargs: Any) -> Dict[str, Any]:
+    """Worker helper for IAMGeneratorService.generate_role."""
+    return _get_worker_service().generate_role(**kwargs)
+
+
+def run_batch_analyze_many(items: List[Tuple[Tuple[str, ...], bool]]) -> List[Any]:
+    """Worker helper for IAMGeneratorService.batch_analyze over (commands, debug) items."""
+    service = _get_worker_service()
+    return [_result_or_exception(service.batch_analyze, list(commands), debug)
+            for commands, debug in items]
+
+
+def run_combined_policy(commands: List[str], debug: bool = False) -> Dict[str, Any]:
+    """Worker helper returning the combined policy document for a batch."""
+    return _get_worker_service().analyzer.analyze_commands(commands, debug=debug).policy_document
+
+
+def run_supported_services() -> List[str]:
+    """Worker helper for IAMGeneratorService.get_supported_services."""
+    return _get_worker_service().get_supported_services()
+
+
+def run_resource_specific_policy(**kwargs: Any) -> Dict[str, Any]:
+    """Worker helper for IAMPermissionAnalyzer.generate_resource_specific_policy."""
+    return _get_worker_service().analyzer.generate_resource_specific_policy(**kwargs)
+
+
+def run_least_privilege_policy(**kwargs: Any) -> Dict[str, Any]:
+    """Worker helper for IAMPermissionAnalyzer.generate_least_privilege_policy."""
+    return _get_worker_service().analyzer.generate_least_privilege_policy(**kwargs)
+
+
+def run_service_summary(commands: List[str]) -> Dict[str, Any]:
+    """Worker helper for IAMPermissionAnalyzer.get_service_summary."""
+    return _get_worker_service().analyzer.get_service_summary(commands)
+
+
+class RequestCoalescer:
+    """
+    Gather concurrent requests into a single worker pool call.
+    
+    Items submitted within one batch window are de-duplicated and split into
+    chunks across the worker pool, so a burst of overlapping requests costs a
+    few executor round trips instead of one per request, and each chunk's
+    requests resolve as soon as that chunk finishes.
+    """
+    
+    def __init__(self, func: Callable[[List[Any]], List[Any]],
+                 window: float = BATCH_WINDOW_SECONDS,
+                 max_batch: int = BATCH_MAX_SIZE,
+                 max_chunk: Optional[int] = None):
+        """
+        Args:
+            func: Worker helper taking a list of hashable items and returning
+                one result (or the exception raised) per item
+            window: Seconds to wait for more items after the first arrives
+            max_batch: Maximum number of items collected in one window
+            max_chunk: Maximum number of items per executor call; by default
+                a window's items are spread evenly over the pool's workers
+        """
+        self._func = func
+        self._window = window
+        self._max_batch = max_batch
+        self._max_chunk = max_chunk
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._dispatches: Set[asyncio.Task] = set()
+    
+    async def submit(self, item: Hashable) -> Any:
+        """Queue an item and wait for its result."""
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.get_running_loop().create_task(self._drain())
+        
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future))
+        return await future
+    
+    async def stop(self) -> None:
+        """Cancel the drain task and any in-flight dispatches."""
+        tasks = list(self._dispatches)
+        if self._task is not None:
+            tasks.append(self._task)
+            self._task = None
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+    
+    async def _drain(self) -> None:
+        """Collect items for one window at a time and dispatch them."""
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            await asyncio.sleep(self._window)
+            while len(batch) < self._max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            # Dispatch without waiting so the next window can fill while
+            # this batch runs on another worker
+            task = asyncio.get_running_loop().create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+    
+    async def _dispatch(self, batch: List[Tuple[Hashable, asyncio.Future]]) -> None:
+        """De-duplicate one window's items and run them as chunks across the pool."""
+        waiting: Dict[Hashable, List[asyncio.Future]] = {}
+        for item, future in batch:
+            waiting.setdefault(item, []).append(future)
+        
+        unique_items = list(waiting)
+        size = self._max_chunk or -(-len(unique_items) // EXECUTOR_MAX_WORKERS)
+        await asyncio.gather(*(
+            self._run_chunk(unique_items[start:start + size], waiting)
+            for start in range(0, len(unique_items), size)
+        ))
+    
+    async def _run_chunk(self, items: List[Hashable],
+                         waiting: Dict[Hashable, List[asyncio.Future]]) -> None:
+        """Run one chunk in the pool and resolve the futures waiting on its items."""
+        try:
+            results = await run_in_executor(self._func, items)
+        except Exception as e:
+            results = [e] * len(items)
+        
+        for item, result in zip(items, results):
+            for future in waiting[item]:
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+
+ANALYZE_COALESCER = RequestCoalescer(run_analyze_many)
+# Each batch item is a whole command list, so every distinct batch gets its
+# own executor call; one slow command then only delays its own request
+BATCH_ANALYZE_COALESCER = RequestCoalescer(run_batch_analyze_many, max_chunk=1)
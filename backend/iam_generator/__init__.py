@@ -2,11 +2,7 @@
 AWS IAM Generator - A tool to analyze AWS CLI commands and generate IAM permissions
 """
 
-from .parser import AWSCLIParser
-from .permissions_db import IAMPermissionsDatabase
-from .analyzer import IAMPermissionAnalyzer
-from .role_generator import IAMRoleGenerator
-from .cli import cli
+import importlib
 
 __version__ = "1.0.0"
 __author__ = "IAM Generator Team"
@@ -19,3 +15,30 @@ __all__ = [
     "IAMRoleGenerator",
     "cli"
 ]
+
+# Submodule defining each public name. They are imported on first access
+# (PEP 562) so importing the package, or just one of its submodules, doesn't
+# pull in click, rich and every other submodule along with it.
+_LAZY_ATTRS = {
+    "AWSCLIParser": "parser",
+    "IAMPermissionsDatabase": "permissions_db",
+    "IAMPermissionAnalyzer": "analyzer",
+    "IAMRoleGenerator": "role_generator",
+    "cli": "cli",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package; for "cli" this also replaces the submodule binding
+    # the import just made, matching the old `from .cli import cli`
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -6,9 +6,12 @@ with permission lookup to generate comprehensive IAM role requirements.
 """
 
 import json
-from typing import Dict, List, Set, Optional, Tuple, Any
+import re
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from pydantic import BaseModel, Field
+from pydantic_core import to_json
 
 from .parser import AWSCLIParser, ParsedCommand
 from .permissions_db import IAMPermissionsDatabase, IAMPermission, CommandPermissions
@@ -27,6 +30,150 @@ try:
 except ImportError:
     DOC_SCRAPER_AVAILABLE = False
 
+# Basic read-only permissions added per service when include_read_only is set.
+# Built once at import; the permissions are never mutated, so every analysis
+# can share them instead of re-validating fresh models.
+_READ_ONLY_PERMISSIONS: Dict[str, Tuple[IAMPermission, ...]] = {
+    service: tuple(IAMPermission(action=action, resource="*") for action in actions)
+    for service, actions in {
+        "s3": ["s3:ListBucket", "s3:GetBucketLocation", "s3:ListAllMyBuckets"],
+        "ec2": ["ec2:Describe*"],
+        "iam": ["iam:List*", "iam:Get*"],
+        "lambda": ["lambda:List*", "lambda:Get*"],
+        "logs": ["logs:Describe*"],
+        "sts": ["sts:GetCallerIdentity"],
+    }.items()
+}
+
+
+def _condition_key(condition: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Hashable, key-order independent form of a policy condition."""
+    if not condition:
+        return None
+    return json.dumps(condition, sort_keys=True)
+
+
+# Actions that read or write data get the secure-transport condition; one
+# case-insensitive search replaces lowercasing plus a scan per keyword
+_DATA_ACTION_RE = re.compile("get|put|post|upload|download", re.IGNORECASE)
+
+# Prefix of every S3 ARN; bucket names start right after it
+_S3_ARN_PREFIX = "arn:aws:s3:::"
+_S3_ARN_PREFIX_LEN = len(_S3_ARN_PREFIX)
+
+# Actions that take the command's specific resource ARN even outside strict
+# mode, per service; built once instead of on every permission
+_SPECIFIC_RESOURCE_ACTIONS: Dict[str, frozenset] = {
+    "s3": frozenset({
+        "s3:GetObject", "s3:PutObject", "s3:DeleteObject", "s3:GetObjectAcl",
+        "s3:PutObjectAcl", "s3:ListBucket", "s3:GetBucketLocation", 
+        "s3:GetBucketAcl", "s3:PutBucketAcl"
+    }),
+    "ec2": frozenset({
+        "ec2:TerminateInstances", "ec2:StopInstances", "ec2:StartInstances",
+        "ec2:RebootInstances", "ec2:DescribeInstances", "ec2:ModifyInstanceAttribute",
+        "ec2:GetConsoleOutput", "ec2:GetConsoleScreenshot"
+    }),
+    "lambda": frozenset({
+        "lambda:InvokeFunction", "lambda:GetFunction", "lambda:UpdateFunctionCode",
+        "lambda:UpdateFunctionConfiguration", "lambda:DeleteFunction",
+        "lambda:AddPermission", "lambda:RemovePermission"
+    }),
+    "dynamodb": frozenset({
+        "dynamodb:GetItem", "dynamodb:PutItem", "dynamodb:UpdateItem",
+        "dynamodb:DeleteItem", "dynamodb:Query", "dynamodb:Scan",
+        "dynamodb:BatchGetItem", "dynamodb:BatchWriteItem"
+    }),
+    "iam": frozenset({
+        "iam:GetUser", "iam:GetRole", "iam:GetPolicy", "iam:AttachRolePolicy",
+        "iam:DetachRolePolicy", "iam:AttachUserPolicy", "iam:DetachUserPolicy",
+        "iam:DeleteUser", "iam:DeleteRole"
+    }),
+}
+
+_S3_OBJECT_ACTIONS = frozenset({"s3:GetObject", "s3:PutObject", "s3:DeleteObject"})
+
+# EC2 resource types matched against the lowercased action, in priority
+# order, with the parameters that carry their IDs
+_EC2_RESOURCE_PARAMS = (
+    ("instance", ("instance-ids", "instance-id")),
+    ("volume", ("volume-ids", "volume-id")),
+)
+
+
+def _s3_locations(params: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """(bucket, key) for every s3:// parameter value, key "" when there is none."""
+    return [
+        value[5:].partition("/")[::2]
+        for value in params.values()
+        if isinstance(value, str) and value.startswith("s3://")
+    ]
+
+
+def _arns_s3(params: Dict[str, Any], action: str, account: str, region: str) -> List[str]:
+    """S3 ARNs: buckets for ListBucket, objects for object-level actions."""
+    if action == "s3:ListBucket":
+        return [f"arn:aws:s3:::{bucket}" for bucket, _ in _s3_locations(params)]
+    if action in _S3_OBJECT_ACTIONS:
+        return [f"arn:aws:s3:::{bucket}/{key or '*'}" for bucket, key in _s3_locations(params)]
+    return []
+
+
+def _arns_ec2(params: Dict[str, Any], action: str, account: str, region: str) -> List[str]:
+    """EC2 instance or volume ARNs, depending on the action name."""
+    action_lower = action.lower()
+    for resource_type, param_names in _EC2_RESOURCE_PARAMS:
+        if resource_type in action_lower:
+            break
+    else:
+        return []
+    
+    arns = []
+    for param in param_names:
+        ids = params.get(param)
+        if ids is None:
+            continue
+        if isinstance(ids, str):
+            ids = [ids]
+        arns.extend(f"arn:aws:ec2:{region}:{account}:{resource_type}/{resource_id}" for resource_id in ids)
+    return arns
+
+
+def _arns_lambda(params: Dict[str, Any], action: str, account: str, region: str) -> List[str]:
+    """Lambda function ARN from --function-name."""
+    function_name = params.get("function-name")
+    if function_name is None:
+        return []
+    return [f"arn:aws:lambda:{region}:{account}:function:{function_name}"]
+
+
+def _arns_dynamodb(params: Dict[str, Any], action: str, account: str, region: str) -> List[str]:
+    """DynamoDB table ARN from --table-name."""
+    table_name = params.get("table-name")
+    if table_name is None:
+        return []
+    return [f"arn:aws:dynamodb:{region}:{account}:table/{table_name}"]
+
+
+def _arns_iam(params: Dict[str, Any], action: str, account: str, region: str) -> List[str]:
+    """IAM role, user or policy ARN, first matching parameter wins."""
+    for param, resource_type in (("role-name", "role"), ("user-name", "user"), ("policy-name", "policy")):
+        name = params.get(param)
+        if name is not None:
+            return [f"arn:aws:iam::{account}:{resource_type}/{name}"]
+    return []
+
+
+# Per-service ARN builders used by _generate_arns_from_command_params; each takes
+# (params, action, account, region) with "*" already substituted for missing values.
+_ARN_HANDLERS: Dict[str, Callable[[Dict[str, Any], str, str, str], List[str]]] = {
+    "s3": _arns_s3,
+    "ec2": _arns_ec2,
+    "lambda": _arns_lambda,
+    "dynamodb": _arns_dynamodb,
+    "iam": _arns_iam,
+}
+
 
 class AnalysisResult(BaseModel):
     """Result of IAM permission analysis."""
@@ -38,6 +185,13 @@ class AnalysisResult(BaseModel):
     warnings: List[str] = Field(default_factory=list, description="Analysis warnings")
     resource_arns: List[str] = Field(default_factory=list, description="Identified resource ARNs")
     services_used: List[str] = Field(default_factory=list, description="AWS services used")
+    permissions_by_command: Dict[str, List[IAMPermission]] = Field(
+        default_factory=dict, description="Permissions contributed by each command, keyed by raw command"
+    )
+    
+    def to_json(self, indent: Optional[int] = None) -> bytes:
+        """Serialize the result straight to JSON bytes via pydantic's serializer."""
+        return to_json(self, indent=indent)
 
 
 class ResourceSpecificPolicy(BaseModel):
@@ -84,7 +238,8 @@ class IAMPermissionAnalyzer:
     
     def analyze_command(self, command: str, 
                        strict_resources: bool = False,
-                       include_read_only: bool = True) -> Dict:
+                       include_read_only: bool = True,
+                       debug: Optional[bool] = None) -> Dict:
         """
         Analyze a single AWS CLI command and generate IAM requirements.
         
@@ -92,19 +247,28 @@ class IAMPermissionAnalyzer:
             command: AWS CLI command string
             strict_resources: If True, generate resource-specific ARN patterns
             include_read_only: If True, include basic read permissions
+            debug: Override debug_mode for this call
             
         Returns:
             Dict with analysis results for backward compatibility with tests
         """
-        # Use analyze_commands for single command
-        result = self.analyze_commands([command], strict_resources, include_read_only)
+        # Single command: skip the batch accumulators and go straight to
+        # the per-command analysis
+        debug_mode = self.debug_mode if debug is None else debug
+        try:
+            parsed_cmd = self.parser.parse_command(command)
+        except ValueError as e:
+            raise ValueError(f"Failed to parse command: {command}") from e
         
-        if not result.commands:
-            raise ValueError(f"Failed to parse command: {command}")
+        warnings = []
+        permissions, found = self._analyze_one(parsed_cmd, command, strict_resources, debug_mode, warnings)
+        if include_read_only:
+            permissions = permissions + self._get_read_only_permissions((parsed_cmd.service,))
         
-        parsed_cmd = result.commands[0]
+        unique_permissions, policy_doc = self._build_policy(permissions)
         
-        # Return format expected by tests
+        # Return format expected by tests; plain attribute access is several
+        # times cheaper than model_dump() and keeps the key set stable
         return {
             "service": parsed_cmd.service,
             "action": parsed_cmd.action,
@@ -115,16 +279,17 @@ class IAMPermissionAnalyzer:
                     "resource": perm.resource,
                     "condition": perm.condition
                 }
-                for perm in result.required_permissions
+                for perm in unique_permissions
             ],
-            "policy_document": result.policy_document,
-            "resource_arns": result.resource_arns,
-            "warnings": result.warnings
+            "policy_document": policy_doc,
+            "resource_arns": list(dict.fromkeys(parsed_cmd.resource_arns)) if found else [],
+            "warnings": warnings
         }
     
     def analyze_commands(self, commands: List[str], 
                         strict_resources: bool = False,
-                        include_read_only: bool = True) -> AnalysisResult:
+                        include_read_only: bool = True,
+                        debug: Optional[bool] = None) -> AnalysisResult:
         """
         Analyze a list of AWS CLI commands and generate IAM requirements.
         
@@ -132,6 +297,8 @@ class IAMPermissionAnalyzer:
             commands: List of AWS CLI command strings
             strict_resources: If True, generate resource-specific ARN patterns
             include_read_only: If True, include basic read permissions
+            debug: Override debug_mode for this call, so one analyzer can
+                serve both debug and non-debug callers
             
         Returns:
             AnalysisResult with comprehensive analysis
@@ -140,83 +307,37 @@ class IAMPermissionAnalyzer:
         all_permissions = []
         missing_commands = []
         warnings = []
-        all_resource_arns = []
-        services_used = set()
+        # Insertion-ordered sets: first-seen order, O(1) de-duplication
+        all_resource_arns: Dict[str, None] = {}
+        services_used: Dict[str, None] = {}
+        permissions_by_command = {}
+        # Repeated (service, action) pairs in a batch hit the database once
+        lookups: Dict[Tuple[str, str], Optional[CommandPermissions]] = {}
+        debug_mode = self.debug_mode if debug is None else debug
+        
+        # Bind hot lookups once; the loop below runs per command and is
+        # string/dict bound, so it gains nothing from a numeric JIT
+        parse_command = self.parser.parse_command
+        analyze_one = self._analyze_one
         
         # Parse and analyze each command
         for command_str in commands:
             try:
                 # Parse command
-                parsed_cmd = self.parser.parse_command(command_str)
+                parsed_cmd = parse_command(command_str)
                 parsed_commands.append(parsed_cmd)
-                services_used.add(parsed_cmd.service)
+                services_used[parsed_cmd.service] = None
                 
-                # Get permissions from database
-                cmd_perms = self.permissions_db.get_permissions_object(
-                    parsed_cmd.service, parsed_cmd.action
+                command_permissions, found = analyze_one(
+                    parsed_cmd, command_str, strict_resources, debug_mode, warnings, lookups
                 )
-                
-                if cmd_perms:
-                    # Add permissions, optionally modifying resources
-                    command_permissions = []
-                    for perm in cmd_perms.permissions:
-                        modified_perm = self._customize_permission_resource(
-                            perm, parsed_cmd, strict_resources
-                        )
-                        command_permissions.append(modified_perm)
-                    
-                    # Enhance with additional permissions
-                    enhanced_permissions = self._enhance_with_additional_permissions(
-                        command_permissions, parsed_cmd
-                    )
-                    all_permissions.extend(enhanced_permissions)
-                    
-                    # Collect resource ARNs
-                    all_resource_arns.extend(parsed_cmd.resource_arns)
-                    
+                all_permissions.extend(command_permissions)
+                if found:
+                    all_resource_arns.update(dict.fromkeys(parsed_cmd.resource_arns))
                 else:
-                    # Command not in database
                     missing_commands.append(command_str)
-                    
-                    # Only generate fallback permission if service is supported
-                    supported_services = self.permissions_db.get_supported_services()
-                    if parsed_cmd.service in supported_services:
-                        # Generate best-guess permission for supported service
-                        fallback_perm = self._generate_fallback_permission(parsed_cmd)
-                        all_permissions.append(fallback_perm)
-                        
-                        if self.debug_mode:
-                            warnings.append(
-                                f"Command '{command_str}' not found in permissions database. "
-                                f"Generated fallback permission: {fallback_perm.action}"
-                            )
-                    else:
-                        # Try using documentation scraper as fallback
-                        scraper_permissions = self._get_scraper_permissions(parsed_cmd)
-                        if scraper_permissions:
-                            all_permissions.extend(scraper_permissions)
-                            if self.debug_mode:
-                                warnings.append(
-                                    f"Command '{command_str}' not found in permissions database. "
-                                    f"Used doc scraper fallback: {[perm.action for perm in scraper_permissions]}"
-                                )
-                        else:
-                            # Try fallback for unknown service
-                            fallback_permissions = self._try_scraper_for_unknown_service(parsed_cmd)
-                            if fallback_permissions:
-                                all_permissions.extend(fallback_permissions)
-                                if self.debug_mode:
-                                    warnings.append(
-                                        f"Unknown service '{parsed_cmd.service}' - used doc scraper: {[perm.action for perm in fallback_permissions]}"
-                                    )
-                            else:
-                                # Last resort - generate basic fallback
-                                fallback_perm = self._generate_fallback_permission(parsed_cmd)
-                                all_permissions.append(fallback_perm)
-                                if self.debug_mode:
-                                    warnings.append(
-                                        f"Unknown command '{command_str}' - generated basic fallback: {fallback_perm.action}"
-                                    )
+                
+                permissions_by_command[command_str] = command_permissions
             
             except ValueError as e:
                 warnings.append(f"Failed to parse command '{command_str}': {str(e)}")
@@ -227,22 +348,100 @@ class IAMPermissionAnalyzer:
             read_only_perms = self._get_read_only_permissions(services_used)
             all_permissions.extend(read_only_perms)
         
-        # Remove duplicate permissions
-        unique_permissions = self._deduplicate_permissions(all_permissions)
-        
-        # Generate policy document
-        policy_doc = self._generate_policy_document(unique_permissions)
+        # Remove duplicate permissions and generate the policy document
+        unique_permissions, policy_doc = self._build_policy(all_permissions)
         
-        return AnalysisResult(
+        # Every field is built here from already-validated models, so skip
+        # re-validating (and copying) the lists on the way out
+        return AnalysisResult.model_construct(
             commands=parsed_commands,
             required_permissions=unique_permissions,
             policy_document=policy_doc,
             missing_commands=missing_commands,
             warnings=warnings,
-            resource_arns=list(set(all_resource_arns)),
-            services_used=list(services_used)
+            resource_arns=list(all_resource_arns),
+            services_used=list(services_used),
+            permissions_by_command=permissions_by_command
         )
     
+    def _analyze_one(self, parsed_cmd: ParsedCommand, command_str: str,
+                     strict_resources: bool, debug_mode: bool,
+                     warnings: List[str],
+                     lookups: Optional[Dict[Tuple[str, str], Optional[CommandPermissions]]] = None
+                     ) -> Tuple[List[IAMPermission], bool]:
+        """
+        Work out the permissions for a single parsed command.
+        
+        Args:
+            parsed_cmd: Parsed command
+            command_str: Original command string, used in warnings
+            strict_resources: If True, generate resource-specific ARN patterns
+            debug_mode: Whether to record fallback warnings
+            warnings: List that fallback warnings are appended to
+            lookups: Optional per-batch memo of database lookups
+            
+        Returns:
+            Tuple of (permissions for the command, whether it was found in the database)
+        """
+        # Get permissions from database, once per (service, action) in a batch
+        key = (parsed_cmd.service, parsed_cmd.action)
+        if lookups is not None and key in lookups:
+            cmd_perms = lookups[key]
+        else:
+            cmd_perms = self.permissions_db.get_permissions_object(*key)
+            if lookups is not None:
+                lookups[key] = cmd_perms
+        
+        if cmd_perms:
+            # Add permissions, optionally modifying resources
+            customize_resource = self._customize_permission_resource
+            command_permissions = [
+                customize_resource(perm, parsed_cmd, strict_resources)
+                for perm in cmd_perms.permissions
+            ]
+            
+            # Enhance with additional permissions
+            return self._enhance_with_additional_permissions(command_permissions, parsed_cmd), True
+        
+        # Command not in database. Only generate fallback permission if service
+        # is supported; a hashed lookup that also sees services discovered mid-batch
+        if self.permissions_db.is_supported_service(parsed_cmd.service):
+            # Generate best-guess permission for supported service
+            fallback_perm = self._generate_fallback_permission(parsed_cmd)
+            if debug_mode:
+                warnings.append(
+                    f"Command '{command_str}' not found in permissions database. "
+                    f"Generated fallback permission: {fallback_perm.action}"
+                )
+            return [fallback_perm], False
+        
+        # Try using documentation scraper as fallback
+        scraper_permissions = self._get_scraper_permissions(parsed_cmd)
+        if scraper_permissions:
+            if debug_mode:
+                warnings.append(
+                    f"Command '{command_str}' not found in permissions database. "
+                    f"Used doc scraper fallback: {[perm.action for perm in scraper_permissions]}"
+                )
+            return list(scraper_permissions), False
+        
+        # Try fallback for unknown service
+        fallback_permissions = self._try_scraper_for_unknown_service(parsed_cmd)
+        if fallback_permissions:
+            if debug_mode:
+                warnings.append(
+                    f"Unknown service '{parsed_cmd.service}' - used doc scraper: {[perm.action for perm in fallback_permissions]}"
+                )
+            return list(fallback_permissions), False
+        
+        # Last resort - generate basic fallback
+        fallback_perm = self._generate_fallback_permission(parsed_cmd)
+        if debug_mode:
+            warnings.append(
+                f"Unknown command '{command_str}' - generated basic fallback: {fallback_perm.action}"
+            )
+        return [fallback_perm], False
+    
     def analyze_single_command(self, command: str) -> AnalysisResult:
         """
         Analyze a single AWS CLI command.
@@ -271,13 +470,9 @@ class IAMPermissionAnalyzer:
         """
         analysis = self.analyze_commands(commands, strict_resources=True)
         
-        # Enhance ARN patterns with account and region info
-        if account_id or region:
-            policy_doc = self._enhance_arn_patterns(
-                analysis.policy_document, account_id, region
-            )
-        else:
-            policy_doc = analysis.policy_document
+        # The analysis is private to this call, so its policy document is
+        # updated in place rather than copied
+        policy_doc = self._enhance_arn_patterns(analysis.policy_document, account_id, region)
         
         # Add conditions for enhanced security
         policy_doc = self._add_security_conditions(policy_doc)
@@ -295,31 +490,46 @@ class IAMPermissionAnalyzer:
             commands: List of AWS CLI commands
             account_id: AWS account ID for ARN generation
             region: AWS region for ARN generation
-            strict_mode: If True, use specific resources whenever possible
+            strict_mode: Kept for compatibility; specific resources are always
+                used where they can be derived from the command
             
         Returns:
             Enhanced policy with resource-specific permissions
         """
-        # Analyze commands with strict resource mode
-        analysis = self.analyze_commands(commands, strict_resources=strict_mode)
-        
-        # Create enhanced permissions with specific resources
+        # Single pass: parse each command and build resource-specific
+        # permissions straight from the database entry. A full analysis here
+        # would customize resources, run scraper fallbacks and add read-only
+        # permissions, none of which end up in this policy.
+        parse_command = self.parser.parse_command
+        get_permissions_object = self.permissions_db.get_permissions_object
+        create_permission = self._create_resource_specific_permission
+        lookups: Dict[Tuple[str, str], Optional[CommandPermissions]] = {}
         enhanced_permissions = []
+        specific_resources_found = 0
         
-        for cmd in analysis.commands:
-            cmd_perms = self.permissions_db.get_permissions_object(cmd.service, cmd.action)
+        for command_str in commands:
+            try:
+                cmd = parse_command(command_str)
+            except ValueError:
+                continue
+            if cmd.resource_arns:
+                specific_resources_found += 1
+            
+            key = (cmd.service, cmd.action)
+            if key in lookups:
+                cmd_perms = lookups[key]
+            else:
+                cmd_perms = lookups[key] = get_permissions_object(*key)
             if not cmd_perms:
                 continue
-                
-            for perm in cmd_perms.permissions:
-                enhanced_perm = self._create_resource_specific_permission(
-                    perm, cmd, account_id, region
-                )
-                enhanced_permissions.append(enhanced_perm)
+            
+            enhanced_permissions.extend(
+                create_permission(perm, cmd, account_id, region)
+                for perm in cmd_perms.permissions
+            )
         
         # Remove duplicates and generate policy
-        unique_permissions = self._deduplicate_permissions(enhanced_permissions)
-        policy_doc = self._generate_policy_document(unique_permissions)
+        unique_permissions, policy_doc = self._build_policy(enhanced_permissions)
         
         # Add metadata about resource specificity
         policy_doc["_metadata"] = {
@@ -327,7 +537,7 @@ class IAMPermissionAnalyzer:
             "account_id": account_id,
             "region": region,
             "commands_analyzed": len(commands),
-            "specific_resources_found": sum(1 for cmd in analysis.commands if cmd.resource_arns)
+            "specific_resources_found": specific_resources_found
         }
         
         return policy_doc
@@ -379,6 +589,10 @@ class IAMPermissionAnalyzer:
         enhanced_resource = self._enhance_single_arn(
             permission.resource, account_id, region
         )
+        if enhanced_resource == permission.resource:
+            # Nothing changed (e.g. "*" or no account/region given); reuse the
+            # database permission instead of validating an identical copy
+            return permission
         
         return IAMPermission(
             action=permission.action,
@@ -403,92 +617,10 @@ class IAMPermissionAnalyzer:
         Returns:
             List of generated ARNs
         """
-        arns = []
-        service = parsed_cmd.service
-        params = parsed_cmd.parameters
-        
-        # S3 specific ARN generation
-        if service == "s3":
-            if action == "s3:ListBucket":
-                # Extract bucket names from s3:// URIs
-                for value in params.values():
-                    if isinstance(value, str) and value.startswith("s3://"):
-                        bucket_name = value.replace("s3://", "").split("/")[0]
-                        arns.append(f"arn:aws:s3:::{bucket_name}")
-                        
-            elif action in ["s3:GetObject", "s3:PutObject", "s3:DeleteObject"]:
-                # Extract object ARNs
-                for value in params.values():
-                    if isinstance(value, str) and value.startswith("s3://"):
-                        s3_uri = value.replace("s3://", "")
-                        if "/" in s3_uri:
-                            bucket_name = s3_uri.split("/")[0]
-                            object_key = "/".join(s3_uri.split("/")[1:])
-                            if object_key:
-                                arns.append(f"arn:aws:s3:::{bucket_name}/{object_key}")
-                            else:
-                                arns.append(f"arn:aws:s3:::{bucket_name}/*")
-                        else:
-                            arns.append(f"arn:aws:s3:::{s3_uri}/*")
-        
-        # EC2 specific ARN generation
-        elif service == "ec2":
-            account = account_id or "*"
-            reg = region or "*"
-            
-            if "instance" in action.lower():
-                instance_params = ["instance-ids", "instance-id"]
-                for param in instance_params:
-                    if param in params:
-                        instances = params[param]
-                        if isinstance(instances, str):
-                            instances = [instances]
-                        for instance_id in instances:
-                            arns.append(f"arn:aws:ec2:{reg}:{account}:instance/{instance_id}")
-            
-            elif "volume" in action.lower():
-                volume_params = ["volume-ids", "volume-id"]
-                for param in volume_params:
-                    if param in params:
-                        volumes = params[param]
-                        if isinstance(volumes, str):
-                            volumes = [volumes]
-                        for volume_id in volumes:
-                            arns.append(f"arn:aws:ec2:{reg}:{account}:volume/{volume_id}")
-        
-        # Lambda specific ARN generation
-        elif service == "lambda":
-            account = account_id or "*"
-            reg = region or "*"
-            
-            if "function-name" in params:
-                function_name = params["function-name"]
-                arns.append(f"arn:aws:lambda:{reg}:{account}:function:{function_name}")
-        
-        # DynamoDB specific ARN generation
-        elif service == "dynamodb":
-            account = account_id or "*"
-            reg = region or "*"
-            
-            if "table-name" in params:
-                table_name = params["table-name"]
-                arns.append(f"arn:aws:dynamodb:{reg}:{account}:table/{table_name}")
-        
-        # IAM specific ARN generation
-        elif service == "iam":
-            account = account_id or "*"
-            
-            if "role-name" in params:
-                role_name = params["role-name"]
-                arns.append(f"arn:aws:iam::{account}:role/{role_name}")
-            elif "user-name" in params:
-                user_name = params["user-name"]
-                arns.append(f"arn:aws:iam::{account}:user/{user_name}")
-            elif "policy-name" in params:
-                policy_name = params["policy-name"]
-                arns.append(f"arn:aws:iam::{account}:policy/{policy_name}")
-        
-        return arns
+        handler = _ARN_HANDLERS.get(parsed_cmd.service)
+        if handler is None:
+            return []
+        return handler(parsed_cmd.parameters, action, account_id or "*", region or "*")
     
     def _customize_permission_resource(self, permission: IAMPermission, 
                                      parsed_cmd: ParsedCommand,
@@ -519,7 +651,9 @@ class IAMPermissionAnalyzer:
         
         # Fallback to strict_resources behavior
         if strict_resources and parsed_cmd.resource_arns:
-            resource = parsed_cmd.resource_arns[0] if parsed_cmd.resource_arns else permission.resource
+            resource = parsed_cmd.resource_arns[0]
+            if resource == permission.resource:
+                return permission
             return IAMPermission(
                 action=permission.action,
                 resource=resource,
@@ -541,25 +675,27 @@ class IAMPermissionAnalyzer:
         Returns:
             Enhanced permissions list
         """
-        enhanced_permissions = permissions.copy()
-        
         # For S3 cp operations with multiple buckets, ensure both buckets are covered
         if (parsed_command.service == "s3" and parsed_command.action == "cp" 
             and len(parsed_command.resource_arns) > 1):
+            enhanced_permissions = permissions.copy()
             
-            # Find bucket ARNs (without object paths)
-            bucket_arns = [arn for arn in parsed_command.resource_arns 
-                          if arn.startswith("arn:aws:s3:::") and "/" not in arn.split(":::")[-1]]
+            # Find bucket ARNs (without object paths); a slice comparison
+            # against the fixed prefix is cheaper than a startswith call
+            bucket_arns = [arn for arn in parsed_command.resource_arns
+                          if arn[:_S3_ARN_PREFIX_LEN] == _S3_ARN_PREFIX
+                          and "/" not in arn[_S3_ARN_PREFIX_LEN:]]
             
-            # For each bucket, ensure we have ListBucket permission
+            # For each bucket, ensure we have ListBucket permission. A grant
+            # whose resource contains the bucket ARN (e.g. an object ARN picked
+            # for the command) counts, so only the ListBucket resources are
+            # collected up front instead of rescanning every permission
+            listed_resources = [
+                perm.resource for perm in enhanced_permissions if perm.action == "s3:ListBucket"
+            ]
             for bucket_arn in bucket_arns:
-                # Check if we already have ListBucket for this bucket
-                has_list_permission = any(
-                    perm.action == "s3:ListBucket" and bucket_arn in str(perm.resource)
-                    for perm in enhanced_permissions
-                )
-                
-                if not has_list_permission:
+                if not any(bucket_arn in resource for resource in listed_resources):
+                    listed_resources.append(bucket_arn)
                     enhanced_permissions.append(IAMPermission(
                         action="s3:ListBucket",
                         resource=bucket_arn,
@@ -570,21 +706,15 @@ class IAMPermissionAnalyzer:
             # For S3 cp, we also need PutObject permissions on destination buckets
             # Since we can't easily distinguish source vs dest, add PutObject for all buckets
             for bucket_arn in bucket_arns:
-                enhanced_permissions.append(IAMPermission(
-                    action="s3:PutObject",
-                    resource=bucket_arn + "/*",
-                    condition=None,
-                    effect="Allow"
-                ))
-                
-                enhanced_permissions.append(IAMPermission(
-                    action="s3:GetObject", 
-                    resource=bucket_arn + "/*",
-                    condition=None,
-                    effect="Allow"
+                enhanced_permissions.extend((
+                    IAMPermission(action="s3:PutObject", resource=bucket_arn + "/*", condition=None, effect="Allow"),
+                    IAMPermission(action="s3:GetObject", resource=bucket_arn + "/*", condition=None, effect="Allow"),
                 ))
+            
+            return enhanced_permissions
         
-        return enhanced_permissions
+        # Nothing to add; callers only read the list, so skip the copy
+        return permissions
     
     def _generate_fallback_permission(self, parsed_cmd: ParsedCommand) -> IAMPermission:
         """
@@ -605,111 +735,101 @@ class IAMPermissionAnalyzer:
             resource="*"
         )
     
-    def _get_read_only_permissions(self, services: Set[str]) -> List[IAMPermission]:
+    def _get_read_only_permissions(self, services: Iterable[str]) -> List[IAMPermission]:
         """
         Get basic read-only permissions for services.
         
         Args:
-            services: Set of AWS service names
+            services: Distinct AWS service names, in the order to emit them
             
         Returns:
             List of read-only permissions
         """
-        read_only_perms = []
-        
-        read_only_actions = {
-            "s3": ["s3:ListBucket", "s3:GetBucketLocation", "s3:ListAllMyBuckets"],
-            "ec2": ["ec2:Describe*"],
-            "iam": ["iam:List*", "iam:Get*"],
-            "lambda": ["lambda:List*", "lambda:Get*"],
-            "logs": ["logs:Describe*"],
-            "sts": ["sts:GetCallerIdentity"],
-        }
-        
-        for service in services:
-            if service in read_only_actions:
-                for action in read_only_actions[service]:
-                    read_only_perms.append(IAMPermission(action=action, resource="*"))
-        
-        return read_only_perms
+        return [
+            perm
+            for service in services
+            for perm in _READ_ONLY_PERMISSIONS.get(service, ())
+        ]
     
-    def _deduplicate_permissions(self, permissions: List[IAMPermission]) -> List[IAMPermission]:
+    def _build_policy(self, permissions: List[IAMPermission]) -> Tuple[List[IAMPermission], Dict]:
         """
-        Remove duplicate permissions, preferring specific resources over wildcards.
+        Deduplicate permissions and generate the IAM policy document in one pass.
+        
+        Duplicates are removed per (action, condition, effect), preferring
+        specific resources over wildcards. Each surviving permission goes
+        straight into the statement for its (resource, effect, condition).
         
         Args:
             permissions: List of permissions
             
         Returns:
-            Deduplicated list of permissions
+            Tuple of (deduplicated permissions, IAM policy document)
         """
-        # Group permissions by action and condition
-        action_groups = {}
+        # Per (action, condition, effect) keep the distinct specific resources
+        # and the first wildcard permission seen
+        action_groups: Dict[Tuple[str, Optional[str], str], Tuple[Dict[str, IAMPermission], List[IAMPermission]]] = {}
+        # Permissions from the same database entry share one condition dict,
+        # so serialize each distinct dict once; ids are stable while the
+        # permissions list keeps the dicts alive
+        condition_keys: Dict[int, Optional[str]] = {}
         
         for perm in permissions:
-            # Create a key based on action and condition (but not resource)
-            key = (perm.action, str(perm.condition), perm.effect)
-            
-            if key not in action_groups:
-                action_groups[key] = []
-            action_groups[key].append(perm)
-        
-        # For each action group, prefer specific resources over wildcards
-        unique_perms = []
-        for group in action_groups.values():
-            if len(group) == 1:
-                unique_perms.append(group[0])
+            condition = perm.condition
+            if condition:
+                condition_key = condition_keys.get(id(condition))
+                if condition_key is None:
+                    condition_key = condition_keys[id(condition)] = _condition_key(condition)
             else:
-                # Sort by resource specificity - specific resources first, wildcards last
-                sorted_group = sorted(group, key=lambda p: (p.resource == "*", p.resource))
-                
-                # If we have both specific and wildcard resources, only keep specific ones
-                specific_resources = [p for p in sorted_group if p.resource != "*"]
-                if specific_resources:
-                    unique_perms.extend(specific_resources)
-                else:
-                    # All are wildcards, keep just one
-                    unique_perms.append(sorted_group[0])
-        
-        return unique_perms
-    
-    def _generate_policy_document(self, permissions: List[IAMPermission]) -> Dict:
-        """
-        Generate IAM policy document from permissions.
-        
-        Args:
-            permissions: List of IAM permissions
-            
-        Returns:
-            IAM policy document
-        """
-        # Group permissions by resource and effect
-        resource_groups = {}
-        
-        for perm in permissions:
-            key = (perm.resource, perm.effect, str(perm.condition))
+                condition_key = None
             
-            if key not in resource_groups:
-                resource_groups[key] = {
-                    "Effect": perm.effect,
-                    "Action": [],
-                    "Resource": perm.resource
-                }
-                if perm.condition:
-                    resource_groups[key]["Condition"] = perm.condition
+            key = (perm.action, condition_key, perm.effect)
+            group = action_groups.get(key)
+            if group is None:
+                group = action_groups[key] = ({}, [])
+            specific, wildcard = group
             
-            resource_groups[key]["Action"].append(perm.action)
-        
-        # Sort actions and remove duplicates
-        statements = []
-        for group in resource_groups.values():
-            group["Action"] = sorted(list(set(group["Action"])))
-            statements.append(group)
+            if perm.resource == "*":
+                if not wildcard:
+                    wildcard.append(perm)
+            elif perm.resource not in specific:
+                specific[perm.resource] = perm
+        
+        # Prefer specific resources over wildcards, in resource order, and
+        # group the survivors by resource and effect as they are emitted
+        unique_perms = []
+        statements: Dict[Tuple[str, str, Optional[str]], Dict] = {}
         
-        return {
+        for (action, condition_key, effect), (specific, wildcard) in action_groups.items():
+            if not specific:
+                kept = wildcard
+            elif len(specific) == 1:
+                kept = list(specific.values())
+            else:
+                kept = [specific[resource] for resource in sorted(specific)]
+            unique_perms.extend(kept)
+            
+            for perm in kept:
+                statement_key = (perm.resource, effect, condition_key)
+                statement = statements.get(statement_key)
+                if statement is None:
+                    statement = statements[statement_key] = {
+                        "Effect": effect,
+                        "Action": [],
+                        "Resource": perm.resource
+                    }
+                    if perm.condition:
+                        statement["Condition"] = perm.condition
+                # Unique per (action, resource) already, so no set() needed
+                statement["Action"].append(action)
+        
+        for statement in statements.values():
+            statement["Action"].sort()
+        
+        policy_doc = {
             "Version": "2012-10-17",
-            "Statement": statements
+            "Statement": list(statements.values())
         }
+        return unique_perms, policy_doc
     
     def _enhance_arn_patterns(self, policy_doc: Dict, 
                             account_id: Optional[str] = None,
@@ -717,20 +837,21 @@ class IAMPermissionAnalyzer:
         """
         Enhance ARN patterns with specific account and region.
         
+        The statements are updated in place; the shallow copy this used to
+        take shared them with the original anyway.
+        
         Args:
-            policy_doc: Original policy document
+            policy_doc: Policy document to update
             account_id: AWS account ID
             region: AWS region
             
         Returns:
-            Enhanced policy document
+            The same policy document, enhanced
         """
         if not account_id and not region:
             return policy_doc
         
-        enhanced_doc = policy_doc.copy()
-        
-        for statement in enhanced_doc["Statement"]:
+        for statement in policy_doc["Statement"]:
             resource = statement.get("Resource", "*")
             
             if isinstance(resource, str) and resource == "*":
@@ -738,45 +859,50 @@ class IAMPermissionAnalyzer:
             
             # Enhance resource ARNs
             if isinstance(resource, list):
-                enhanced_resources = []
-                for res in resource:
-                    enhanced_res = self._enhance_single_arn(res, account_id, region)
-                    enhanced_resources.append(enhanced_res)
-                statement["Resource"] = enhanced_resources
+                statement["Resource"] = [
+                    self._enhance_single_arn(res, account_id, region) for res in resource
+                ]
             else:
                 statement["Resource"] = self._enhance_single_arn(resource, account_id, region)
         
-        return enhanced_doc
+        return policy_doc
     
     def _enhance_single_arn(self, arn: str, account_id: Optional[str], region: Optional[str]) -> str:
         """Enhance a single ARN with account and region info."""
-        if not arn.startswith("arn:aws:"):
+        # A wildcard region or account always shows up as ":*:"; most ARNs
+        # are already specific, so skip them before any splitting
+        if ":*:" not in arn or not arn.startswith("arn:aws:"):
             return arn
         
-        parts = arn.split(":")
-        if len(parts) >= 6:
-            # parts: ["arn", "aws", "service", "region", "account", "resource"]
-            if account_id and parts[4] == "*":
-                parts[4] = account_id
-            if region and parts[3] == "*":
-                parts[3] = region
-            
-            return ":".join(parts)
+        # parts: ["arn", "aws", "service", "region", "account", "resource"];
+        # maxsplit keeps resource paths containing ":" in one piece
+        parts = arn.split(":", 5)
+        if len(parts) < 6:
+            return arn
+        
+        substitute_region = region and parts[3] == "*"
+        substitute_account = account_id and parts[4] == "*"
+        if not (substitute_region or substitute_account):
+            return arn
         
-        return arn
+        if substitute_account:
+            parts[4] = account_id
+        if substitute_region:
+            parts[3] = region
+        
+        return ":".join(parts)
     
     def _add_security_conditions(self, policy_doc: Dict) -> Dict:
         """
-        Add security conditions to policy statements.
+        Add security conditions to policy statements, in place.
         
         Args:
-            policy_doc: Original policy document
+            policy_doc: Policy document to update
             
         Returns:
-            Policy document with security conditions
+            The same policy document, with security conditions
         """
-        enhanced_doc = policy_doc.copy()
-        
+
         # Common security conditions
         security_conditions = {
             "Bool": {
@@ -784,19 +910,13 @@ class IAMPermissionAnalyzer:
             }
         }
         
-        for statement in enhanced_doc["Statement"]:
+        for statement in policy_doc["Statement"]:
             # Add secure transport condition for data operations
             actions = statement.get("Action", [])
             if isinstance(actions, str):
                 actions = [actions]
             
-            data_actions = [
-                action for action in actions 
-                if any(keyword in action.lower() for keyword in 
-                      ["get", "put", "post", "upload", "download"])
-            ]
-            
-            if data_actions:
+            if any(_DATA_ACTION_RE.search(action) for action in actions):
                 existing_conditions = statement.get("Condition", {})
                 # Merge conditions
                 for key, value in security_conditions.items():
@@ -807,7 +927,7 @@ class IAMPermissionAnalyzer:
                 
                 statement["Condition"] = existing_conditions
         
-        return enhanced_doc
+        return policy_doc
     
     def get_service_summary(self, commands: List[str]) -> Dict[str, Dict]:
         """
@@ -820,32 +940,28 @@ class IAMPermissionAnalyzer:
             Summary dictionary with services and their actions
         """
         analysis = self.analyze_commands(commands)
-        summary = {}
         
+        # Insertion-ordered sets (dict keys) per service, emitted as lists
+        summary: Dict[str, Dict[str, Dict[str, None]]] = defaultdict(
+            lambda: {"actions": {}, "permissions": {}, "resources": {}}
+        )
         for cmd in analysis.commands:
-            if cmd.service not in summary:
-                summary[cmd.service] = {
-                    "actions": set(),
-                    "permissions": set(),
-                    "resources": set()
-                }
-            
-            summary[cmd.service]["actions"].add(cmd.action)
-            summary[cmd.service]["resources"].update(cmd.resource_arns)
-        
-        # Add permissions
-        for perm in analysis.required_permissions:
-            service = perm.action.split(":")[0] if ":" in perm.action else "unknown"
+            service_data = summary[cmd.service]
+            service_data["actions"][cmd.action] = None
+            service_data["resources"].update(dict.fromkeys(cmd.resource_arns))
+        
+        # Add permissions; the same action often appears with several
+        # resources, so each distinct action is split only once
+        for action in dict.fromkeys(perm.action for perm in analysis.required_permissions):
+            service, sep, _ = action.partition(":")
+            service = service if sep else "unknown"
             if service in summary:
-                summary[service]["permissions"].add(perm.action)
+                summary[service]["permissions"][action] = None
         
-        # Convert sets to lists for JSON serialization
-        for service_data in summary.values():
-            for key in service_data:
-                if isinstance(service_data[key], set):
-                    service_data[key] = list(service_data[key])
-        
-        return summary
+        return {
+            service: {key: list(values) for key, values in service_data.items()}
+            for service, service_data in summary.items()
+        }
 
     def get_auto_discovery_stats(self) -> Dict:
         """
@@ -922,11 +1038,11 @@ class IAMPermissionAnalyzer:
             return []
         
         try:
-            # Check if the scraper knows about this service
-            services = self._doc_scraper.discover_services()
+            # Check if the scraper knows about this service; the command list is
+            # fetched concurrently and only used if it does
+            services, commands = self._doc_scraper.discover_service_commands(parsed_cmd.service)
             if parsed_cmd.service in services:
-                # Service exists, try to discover the command
-                commands = self._doc_scraper.discover_commands(parsed_cmd.service)
+                # Service exists, check the command
                 command_names = [cmd.command for cmd in commands]
                 
                 if parsed_cmd.action in command_names:
@@ -954,37 +1070,7 @@ class IAMPermissionAnalyzer:
         Returns:
             True if specific resources should be used, False otherwise
         """
-        # Define actions that should use specific resources when available
-        specific_resource_actions = {
-            "s3": {
-                "s3:GetObject", "s3:PutObject", "s3:DeleteObject", "s3:GetObjectAcl",
-                "s3:PutObjectAcl", "s3:ListBucket", "s3:GetBucketLocation", 
-                "s3:GetBucketAcl", "s3:PutBucketAcl"
-            },
-            "ec2": {
-                "ec2:TerminateInstances", "ec2:StopInstances", "ec2:StartInstances",
-                "ec2:RebootInstances", "ec2:DescribeInstances", "ec2:ModifyInstanceAttribute",
-                "ec2:GetConsoleOutput", "ec2:GetConsoleScreenshot"
-            },
-            "lambda": {
-                "lambda:InvokeFunction", "lambda:GetFunction", "lambda:UpdateFunctionCode",
-                "lambda:UpdateFunctionConfiguration", "lambda:DeleteFunction",
-                "lambda:AddPermission", "lambda:RemovePermission"
-            },
-            "dynamodb": {
-                "dynamodb:GetItem", "dynamodb:PutItem", "dynamodb:UpdateItem",
-                "dynamodb:DeleteItem", "dynamodb:Query", "dynamodb:Scan",
-                "dynamodb:BatchGetItem", "dynamodb:BatchWriteItem"
-            },
-            "iam": {
-                "iam:GetUser", "iam:GetRole", "iam:GetPolicy", "iam:AttachRolePolicy",
-                "iam:DetachRolePolicy", "iam:AttachUserPolicy", "iam:DetachUserPolicy",
-                "iam:DeleteUser", "iam:DeleteRole"
-            }
-        }
-        
-        service_actions = specific_resource_actions.get(service, set())
-        return action in service_actions
+        return action in _SPECIFIC_RESOURCE_ACTIONS.get(service, ())
 
     def _select_appropriate_resource_arn(self, action: str, resource_arns: List[str]) -> Optional[str]:
         """
@@ -1002,19 +1088,15 @@ class IAMPermissionAnalyzer:
             
         # For most cases, just return the first ARN
         # This could be enhanced with more sophisticated matching logic
-        service = action.split(":")[0] if ":" in action else ""
-        
-        # Filter ARNs by service if possible
-        matching_arns = [
-            arn for arn in resource_arns 
-            if service in arn or arn.startswith(f"arn:aws:{service}:")
-        ]
-        
-        if matching_arns:
-            return matching_arns[0]
-            
-        # Fallback to first ARN if no service-specific match
-        return resource_arns[0]
+        service, sep, _ = action.partition(":")
+        if not sep:
+            service = ""
+        
+        # Prefer the first ARN mentioning the service, falling back to the
+        # first ARN; stop at the first match instead of filtering them all.
+        # An "arn:aws:<service>:" prefix always contains the service name, so
+        # the substring test alone covers it
+        return next((arn for arn in resource_arns if service in arn), resource_arns[0])
 
 # Example usage
 if __name__ == "__main__":
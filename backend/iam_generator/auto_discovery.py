@@ -7,15 +7,19 @@ the IAM permissions database with dynamically discovered AWS services and comman
 
 import json
 import logging
+import os
 from typing import Dict, List, Optional, Set
 from pathlib import Path
 from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 import threading
 import time
 
-from .permissions_db import IAMPermission, CommandPermissions, IAMPermissionsDatabase
-from .doc_scraper import AWSCLIDocumentationScraper
+import pydantic_core
+
+from .permissions_db import CommandPermissions, IAMPermissionsDatabase
+from .doc_scraper import AWSCLIDocumentationScraper, MAX_DISCOVERY_WORKERS
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +44,13 @@ class AutoDiscoveryCache:
         self.cache_file = Path(cache_file)
         self.cache: Dict[str, CachedPermission] = {}
         self.cache_lock = threading.Lock()
+        # Serializes disk writes; a pending flag lets bursts of discoveries
+        # share one background save instead of a thread per entry
+        self._save_lock = threading.Lock()
+        self._save_pending = False
+        # Services present in the cache, maintained alongside it so lookups
+        # don't rescan every entry
+        self._cached_services: Set[str] = set()
         self._load_cache()
         
     def _load_cache(self):
@@ -52,34 +63,49 @@ class AutoDiscoveryCache:
                 # Convert to CachedPermission objects
                 for key, item in data.items():
                     self.cache[key] = CachedPermission(**item)
+                self._cached_services = {cached.service for cached in self.cache.values()}
                     
-                logger.info(f"Loaded {len(self.cache)} cached permissions from {self.cache_file}")
+                logger.info("Loaded %s cached permissions from %s", len(self.cache), self.cache_file)
             else:
                 logger.info("No existing cache file found, starting with empty cache")
                 
         except Exception as e:
-            logger.warning(f"Failed to load cache from {self.cache_file}: {e}")
+            logger.warning("Failed to load cache from %s: %s", self.cache_file, e)
             self.cache = {}
+            self._cached_services = set()
     
     def _save_cache(self):
         """Save cache to disk."""
         try:
-            with self.cache_lock:
-                # Convert to serializable format
-                data = {}
-                for key, cached_perm in self.cache.items():
-                    data[key] = asdict(cached_perm)
+            with self._save_lock:
+                # Snapshot under the cache lock, but serialize and write outside
+                # it so lookups are not blocked on disk I/O
+                with self.cache_lock:
+                    self._save_pending = False
+                    data = {key: asdict(cached_perm) for key, cached_perm in self.cache.items()}
                 
-                # Atomic write
-                temp_file = self.cache_file.with_suffix('.tmp')
-                with open(temp_file, 'w') as f:
-                    json.dump(data, f, indent=2)
+                # Encoded straight to UTF-8 bytes, skipping the intermediate str
+                # json.dumps would build and write_text would encode again
+                payload = pydantic_core.to_json(data, indent=2)
                 
+                # Atomic write; the temp name is per process because every
+                # API worker process shares the same cache file
+                temp_file = self.cache_file.with_suffix(f'.{os.getpid()}.tmp')
+                temp_file.write_bytes(payload)
                 temp_file.replace(self.cache_file)
-                logger.debug(f"Saved {len(self.cache)} cached permissions to {self.cache_file}")
+                logger.debug("Saved %s cached permissions to %s", len(data), self.cache_file)
                 
         except Exception as e:
-            logger.error(f"Failed to save cache to {self.cache_file}: {e}")
+            logger.error("Failed to save cache to %s: %s", self.cache_file, e)
+    
+    def _schedule_save(self):
+        """Save the cache in the background unless a save is already queued."""
+        with self.cache_lock:
+            if self._save_pending:
+                return
+            self._save_pending = True
+        
+        threading.Thread(target=self._save_cache, daemon=True).start()
     
     def get_cache_key(self, service: str, command: str) -> str:
         """Generate cache key for service and command."""
@@ -97,23 +123,15 @@ class AutoDiscoveryCache:
                 cached.last_accessed = datetime.now().isoformat()
                 cached.access_count += 1
                 
-                # Convert back to CommandPermissions
-                permissions = []
-                for perm_data in cached.permissions:
-                    permissions.append(IAMPermission(
-                        action=perm_data['action'],
-                        resource=perm_data['resource'],
-                        condition=perm_data.get('condition'),
-                        effect=perm_data.get('effect', 'Allow')
-                    ))
-                
-                return CommandPermissions(
-                    service=cached.service,
-                    action=cached.command,
-                    permissions=permissions,
-                    description=cached.description,
-                    resource_patterns=cached.resource_patterns
-                )
+                # Convert back to CommandPermissions; the stored permission dicts
+                # are validated in the same call rather than built one by one
+                return CommandPermissions.model_validate({
+                    "service": cached.service,
+                    "action": cached.command,
+                    "permissions": cached.permissions,
+                    "description": cached.description,
+                    "resource_patterns": cached.resource_patterns
+                })
         
         return None
     
@@ -123,14 +141,16 @@ class AutoDiscoveryCache:
         cache_key = self.get_cache_key(service, command)
         
         # Convert permissions to serializable format
-        perm_data = []
-        for perm in permissions.permissions:
-            perm_data.append({
+        perm_data = [
+            {
                 'action': perm.action,
                 'resource': perm.resource,
                 'condition': perm.condition,
                 'effect': perm.effect
-            })
+            }
+            for perm in permissions.permissions
+        ]
+        now = datetime.now().isoformat()
         
         cached_perm = CachedPermission(
             service=service,
@@ -139,18 +159,19 @@ class AutoDiscoveryCache:
             confidence=confidence,
             description=permissions.description,
             resource_patterns=permissions.resource_patterns,
-            discovered_at=datetime.now().isoformat(),
-            last_accessed=datetime.now().isoformat(),
+            discovered_at=now,
+            last_accessed=now,
             access_count=1
         )
         
         with self.cache_lock:
             self.cache[cache_key] = cached_perm
+            self._cached_services.add(service)
             
         # Save to disk asynchronously
-        threading.Thread(target=self._save_cache, daemon=True).start()
+        self._schedule_save()
         
-        logger.info(f"Cached permissions for {service} {command} (confidence: {confidence})")
+        logger.info("Cached permissions for %s %s (confidence: %s)", service, command, confidence)
     
     def is_cached(self, service: str, command: str) -> bool:
         """Check if service command is cached."""
@@ -159,7 +180,11 @@ class AutoDiscoveryCache:
     
     def get_cached_services(self) -> Set[str]:
         """Get set of all cached services."""
-        return {cached.service for cached in self.cache.values()}
+        return set(self._cached_services)
+    
+    def has_service(self, service: str) -> bool:
+        """Check if any command of a service is cached."""
+        return service in self._cached_services
     
     def get_cached_commands(self, service: str) -> List[str]:
         """Get list of cached commands for a service."""
@@ -180,9 +205,11 @@ class AutoDiscoveryCache:
             
             for key in old_keys:
                 del self.cache[key]
+            if old_keys:
+                self._cached_services = {cached.service for cached in self.cache.values()}
         
         if old_keys:
-            logger.info(f"Cleaned up {len(old_keys)} old cache entries")
+            logger.info("Cleaned up %s old cache entries", len(old_keys))
             self._save_cache()
     
     def get_stats(self) -> Dict:
@@ -237,7 +264,7 @@ class EnhancedPermissionsDatabase(IAMPermissionsDatabase):
         # Check auto-discovery cache
         cached_perms = self.auto_cache.get_cached_permissions(service, action)
         if cached_perms:
-            logger.debug(f"Using cached permissions for {service} {action}")
+            logger.debug("Using cached permissions for %s %s", service, action)
             return cached_perms
         
         # Try to discover using scraper
@@ -249,9 +276,9 @@ class EnhancedPermissionsDatabase(IAMPermissionsDatabase):
             # Only cache high and medium confidence discoveries
             if confidence in ['high', 'medium']:
                 self.auto_cache.cache_permissions(service, action, discovered_perms, confidence)
-                logger.info(f"Auto-discovered and cached {service} {action} (confidence: {confidence})")
+                logger.info("Auto-discovered and cached %s %s (confidence: %s)", service, action, confidence)
             else:
-                logger.debug(f"Discovered {service} {action} but not caching (low confidence)")
+                logger.debug("Discovered %s %s but not caching (low confidence)", service, action)
             
             return discovered_perms
         
@@ -263,28 +290,30 @@ class EnhancedPermissionsDatabase(IAMPermissionsDatabase):
             return None
         
         try:
+            known_services, commands = self.scraper.discover_service_commands(service)
+            
             # Check if service exists
-            known_services = self.scraper.discover_services()
             if service not in known_services:
-                logger.debug(f"Service {service} not found by scraper")
+                logger.debug("Service %s not found by scraper", service)
                 return None
             
             # Check if command exists for this service
-            commands = self.scraper.discover_commands(service)
-            command_names = [cmd.command for cmd in commands]
+            command_names = {cmd.command for cmd in commands}
             
             if action not in command_names:
-                logger.debug(f"Command {action} not found in service {service}")
+                logger.debug("Command %s not found in service %s", action, service)
                 return None
             
             # Map command to permissions
             permissions = self.scraper.map_command_to_permissions(service, action)
-            logger.debug(f"Discovered permissions for {service} {action}: {[p.action for p in permissions.permissions]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Discovered permissions for %s %s: %s",
+                             service, action, [p.action for p in permissions.permissions])
             
             return permissions
             
         except Exception as e:
-            logger.warning(f"Failed to discover permissions for {service} {action}: {e}")
+            logger.warning("Failed to discover permissions for %s %s: %s", service, action, e)
             return None
     
     def get_supported_services(self) -> List[str]:
@@ -298,29 +327,47 @@ class EnhancedPermissionsDatabase(IAMPermissionsDatabase):
         
         return manual_services
     
-    def preload_high_priority_services(self, services: List[str], max_commands_per_service: int = 5):
+    def is_supported_service(self, service: str) -> bool:
+        """Check manual and auto-discovered services without building the list."""
+        if super().is_supported_service(service):
+            return True
+        return bool(self.enable_auto_discovery and self.auto_cache and self.auto_cache.has_service(service))
+    
+    def preload_high_priority_services(self, services: List[str], max_commands_per_service: int = 5,
+                                       max_workers: int = MAX_DISCOVERY_WORKERS):
         """Preload high-priority services into the cache."""
         if not self.enable_auto_discovery:
             logger.warning("Auto-discovery disabled, cannot preload services")
             return
         
-        logger.info(f"Preloading {len(services)} high-priority services...")
+        logger.info("Preloading %s high-priority services...", len(services))
         
-        for service in services:
-            try:
-                commands = self.scraper.discover_commands(service)
-                
-                # Focus on high-confidence commands
-                high_conf_commands = [c for c in commands if c.confidence == 'high'][:max_commands_per_service]
-                
-                for cmd in high_conf_commands:
-                    if not self.auto_cache.is_cached(service, cmd.command):
-                        self._discover_permissions(service, cmd.command)
-                        
-                logger.info(f"Preloaded {len(high_conf_commands)} commands for {service}")
-                        
-            except Exception as e:
-                logger.warning(f"Failed to preload service {service}: {e}")
+        # Discovery shells out once per service, so overlap the subprocesses
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(services)))) as pool:
+            futures = {
+                pool.submit(self._preload_service, service, max_commands_per_service): service
+                for service in services
+            }
+            for future in as_completed(futures):
+                service = futures[future]
+                try:
+                    preloaded = future.result()
+                    logger.info("Preloaded %s commands for %s", preloaded, service)
+                except Exception as e:
+                    logger.warning("Failed to preload service %s: %s", service, e)
+    
+    def _preload_service(self, service: str, max_commands: int) -> int:
+        """Preload one service's high-confidence commands; returns how many were considered."""
+        commands = self.scraper.discover_commands(service)
+        
+        # Focus on high-confidence commands
+        high_conf_commands = [c for c in commands if c.confidence == 'high'][:max_commands]
+        
+        for cmd in high_conf_commands:
+            if not self.auto_cache.is_cached(service, cmd.command):
+                self._discover_permissions(service, cmd.command)
+        
+        return len(high_conf_commands)
     
     def get_auto_discovery_stats(self) -> Dict:
         """Get auto-discovery statistics."""
@@ -342,7 +389,7 @@ def background_preloader(database: EnhancedPermissionsDatabase,
         database.preload_high_priority_services(high_priority_services)
         logger.info("Background preloader completed successfully")
     except Exception as e:
-        logger.error(f"Background preloader failed: {e}")
+        logger.error("Background preloader failed: %s", e)
 
 # High-priority services that are commonly requested
 HIGH_PRIORITY_SERVICES = [
@@ -5,26 +5,157 @@ This module provides a command-line interface for analyzing AWS CLI commands
 and generating IAM permissions and roles.
 """
 
-import json
 import sys
+from contextlib import ExitStack
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
 import click
+import pydantic_core
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.tree import Tree
 
 from .analyzer import IAMPermissionAnalyzer
 from .role_generator import IAMRoleGenerator
-from .doc_scraper import AWSCLIDocumentationScraper
+from .parser import AWSCLIParser
+from .doc_scraper import AWSCLIDocumentationScraper, _py_str
 
 
 console = Console()
 
 
+@lru_cache(maxsize=8)
+def _cached_analyzer(factory, **options):
+    return factory(**options)
+
+
+def _get_analyzer(**options) -> IAMPermissionAnalyzer:
+    """
+    Return a shared analyzer for the given options.
+    
+    The permissions database and auto-discovery state are loaded once per
+    process, so repeated invocations (e.g. through CliRunner or an embedding
+    process) reuse them. The class is part of the cache key so that patching
+    it gives a fresh instance.
+    """
+    return _cached_analyzer(IAMPermissionAnalyzer, **options)
+
+
+# Entries written by `scrape-docs --update-existing`, formatted once per command
+_MISSING_COMMAND_TEMPLATE = '''    # {service_name}:{command_name}
+    {command}: CommandPermissions(
+        service={service},
+        action={action},
+        permissions=[
+{permissions}        ],
+        description={description},
+        resource_patterns={resource_patterns}
+    ),
+'''
+
+_MISSING_PERMISSION_TEMPLATE = '''            IAMPermission(action={action}, resource={resource}),
+'''
+
+
+def _write_json(filepath, data: Any) -> None:
+    """Write data as indented JSON, encoded in one pass by pydantic-core."""
+    Path(filepath).write_bytes(pydantic_core.to_json(data, indent=2))
+
+
+def _result_or_exception(analyzer: IAMPermissionAnalyzer, command: str) -> Any:
+    """Analyze command, returning the exception instead of raising it."""
+    try:
+        return analyzer.analyze_command(command)
+    except Exception as e:
+        return e
+
+
+def _analyze_in_worker(item) -> Any:
+    """Process-pool task for one (command, debug) item, using the worker's own analyzer."""
+    command, debug = item
+    return _result_or_exception(_get_analyzer(debug_mode=debug), command)
+
+
+def _yaml_text(data: Any) -> str:
+    """Block-style YAML text, emitted by libyaml when PyYAML was built with it."""
+    import yaml
+    dumper = getattr(yaml, "CDumper", yaml.Dumper)
+    return yaml.dump(data, Dumper=dumper, default_flow_style=False)
+
+
+def _iter_batch_results(analyzer: Optional[IAMPermissionAnalyzer], commands: List[str],
+                        jobs: int = 1, debug: bool = False):
+    """
+    Analyze commands, yielding (command, result) in input order with progress output.
+    
+    Each distinct command is analyzed once; repeats in the input reuse the
+    first result. With jobs > 1 the distinct commands are spread over a
+    process pool in chunks, so each worker loads the permissions database
+    once and pickling overhead stays small next to the parsing work; the
+    analyzer argument is unused then and may be None.
+    """
+    unique_commands = list(dict.fromkeys(commands))
+    with ExitStack() as stack:
+        if jobs > 1:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            # Spawned rather than forked, like the API's pool: an analyzer
+            # built in this process runs the auto-discovery preloader threads
+            pool = stack.enter_context(ProcessPoolExecutor(
+                max_workers=jobs,
+                mp_context=multiprocessing.get_context("spawn")
+            ))
+            outcomes = pool.map(_analyze_in_worker, [(command, debug) for command in unique_commands],
+                                chunksize=max(1, len(unique_commands) // (jobs * 4)))
+        else:
+            outcomes = (_result_or_exception(analyzer, command) for command in unique_commands)
+        
+        # Outcomes arrive in first-seen order, so a command not seen before
+        # always takes the next one
+        seen: Dict[str, Any] = {}
+        for i, command in enumerate(commands, 1):
+            if command not in seen:
+                seen[command] = next(outcomes)
+            result = seen[command]
+            console.print(f"[yellow]({i}/{len(commands)})[/yellow] {command}")
+            
+            if isinstance(result, Exception):
+                console.print(f"[red]  Error:[/red] {str(result)}")
+                result = {"error": str(result)}
+            yield command, result
+
+
+def _json_text(data: Any) -> str:
+    """Indented JSON text for display, encoded by pydantic-core like _write_json."""
+    return pydantic_core.to_json(data, indent=2).decode()
+
+
+# Syntax highlighting language for each generate-role output format
+_ROLE_FORMAT_LEXERS = {
+    "terraform": "hcl",
+    "cloudformation": "yaml",
+    "aws-cli": "yaml",
+    "json": "json",
+}
+
+# Above this many rows, permission tables are printed as plain columns
+_TABLE_MAX_ROWS = 200
+
+# Above this size Pygments highlighting costs more than it helps on screen
+_HIGHLIGHT_MAX_CHARS = 64 * 1024
+
+
+def _print_code(code: str, lexer: str) -> None:
+    """Print code with syntax highlighting, or as plain text when piped or large."""
+    if not console.is_terminal or len(code) > _HIGHLIGHT_MAX_CHARS:
+        click.echo(code)
+    else:
+        from rich.syntax import Syntax
+        console.print(Syntax(code, lexer, theme="monokai"))
+
+
 @click.group()
 @click.version_option(version="1.0.0")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
@@ -65,18 +196,19 @@ def analyze(ctx: click.Context, command: tuple, output: str, save: Optional[str]
         console.print(f"[blue]Analyzing command:[/blue] {full_command}")
     
     try:
-        analyzer = IAMPermissionAnalyzer(debug_mode=debug)
+        analyzer = _get_analyzer(debug_mode=debug)
         result = analyzer.analyze_command(full_command)
         
+        rendered = None
         if output == "table":
             _display_table_output(result)
         elif output == "json":
-            _display_json_output(result)
+            rendered = _display_json_output(result)
         elif output == "yaml":
-            _display_yaml_output(result)
+            rendered = _display_yaml_output(result)
         
         if save:
-            _save_output(result, save, output)
+            _save_output(result, save, output, rendered)
             console.print(f"[green]Output saved to:[/green] {save}")
             
     except Exception as e:
@@ -119,16 +251,15 @@ def generate_role(ctx: click.Context, command: tuple, role_name: str,
         console.print(f"[blue]Generating role for command:[/blue] {full_command}")
     
     try:
-        analyzer = IAMPermissionAnalyzer(debug_mode=debug)
-        analysis_result = analyzer.analyze_command(full_command)
-        
-        role_generator = IAMRoleGenerator()
-        
-        # Validate cross-account parameters
+        # Validate cross-account parameters before doing any analysis
         if trust_policy == "cross-account" and not account_id:
             console.print("[red]Error:[/red] --account-id is required for cross-account trust policy")
             sys.exit(1)
         
+        analyzer = _get_analyzer(debug_mode=debug)
+        analysis_result = analyzer.analyze_command(full_command)
+        
+        role_generator = IAMRoleGenerator()
         role_config = role_generator.generate_role(
             analysis_result=analysis_result,
             role_name=role_name,
@@ -139,23 +270,17 @@ def generate_role(ctx: click.Context, command: tuple, role_name: str,
         if output_format == "terraform":
             output_content = role_config["terraform"]
         elif output_format == "cloudformation":
-            output_content = role_config["cloudformation"]
+            output_content = role_generator._generate_cloudformation_text(role_config)
         elif output_format == "aws-cli":
             output_content = role_config["aws_cli"]
         else:  # json
-            output_content = json.dumps(role_config["json"], indent=2)
+            output_content = _json_text(role_config["json"])
         
         if save:
-            with open(save, "w") as f:
-                f.write(output_content)
+            Path(save).write_text(output_content)
             console.print(f"[green]Role configuration saved to:[/green] {save}")
         else:
-            if output_format in ["terraform", "cloudformation", "aws-cli"]:
-                syntax = Syntax(output_content, "hcl" if output_format == "terraform" else "yaml")
-                console.print(syntax)
-            else:
-                syntax = Syntax(output_content, "json")
-                console.print(syntax)
+            _print_code(output_content, _ROLE_FORMAT_LEXERS[output_format])
         
     except Exception as e:
         console.print(f"[red]Error generating role:[/red] {str(e)}")
@@ -169,11 +294,14 @@ def generate_role(ctx: click.Context, command: tuple, role_name: str,
 @click.argument("commands_file", type=click.Path(exists=True))
 @click.option("--output-dir", "-o", type=click.Path(), default="./iam-analysis",
               help="Output directory for analysis results")
-@click.option("--format", "-f", type=click.Choice(["json", "yaml"]), 
-              default="json", help="Output format")
+@click.option("--format", "-f", type=click.Choice(["json", "yaml", "ndjson"]), 
+              default="json", help="Output format (ndjson streams one result per line)")
 @click.option("--debug", "-d", is_flag=True, help="Enable debug mode to show fallback warnings")
+@click.option("--jobs", "-j", type=click.IntRange(min=1), default=1,
+              help="Worker processes to analyze commands in parallel")
 @click.pass_context
-def batch_analyze(ctx: click.Context, commands_file: str, output_dir: str, format: str, debug: bool) -> None:
+def batch_analyze(ctx: click.Context, commands_file: str, output_dir: str, format: str, debug: bool,
+                  jobs: int) -> None:
     """
     Analyze multiple AWS CLI commands from a file.
     
@@ -184,34 +312,26 @@ def batch_analyze(ctx: click.Context, commands_file: str, output_dir: str, forma
     
     try:
         with open(commands_file, "r") as f:
-            commands = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+            commands = AWSCLIParser.normalize_commands(f)
         
         console.print(f"[blue]Analyzing {len(commands)} commands...[/blue]")
         
-        analyzer = IAMPermissionAnalyzer(debug_mode=debug)
-        results = {}
-        
-        for i, command in enumerate(commands, 1):
-            if not command.startswith("aws "):
-                command = f"aws {command}"
-            
-            console.print(f"[yellow]({i}/{len(commands)})[/yellow] {command}")
-            
-            try:
-                result = analyzer.analyze_command(command)
-                results[command] = result
-            except Exception as e:
-                console.print(f"[red]  Error:[/red] {str(e)}")
-                results[command] = {"error": str(e)}
-        
-        # Save results
+        # Worker processes build their own analyzers
+        analyzer = _get_analyzer(debug_mode=debug) if jobs == 1 else None
         output_file = output_path / f"batch_analysis.{format}"
-        with open(output_file, "w") as f:
+        
+        if format == "ndjson":
+            # One record per line, written as each command finishes, so the
+            # full result set is never held in memory
+            with open(output_file, "wb") as f:
+                for command, result in _iter_batch_results(analyzer, commands, jobs, debug):
+                    f.write(pydantic_core.to_json({"command": command, "result": result}) + b"\n")
+        else:
+            results = dict(_iter_batch_results(analyzer, commands, jobs, debug))
             if format == "json":
-                json.dump(results, f, indent=2)
+                _write_json(output_file, results)
             else:  # yaml
-                import yaml
-                yaml.dump(results, f, default_flow_style=False)
+                output_file.write_text(_yaml_text(results))
         
         console.print(f"[green]Batch analysis complete. Results saved to:[/green] {output_file}")
         
@@ -229,8 +349,11 @@ def batch_analyze(ctx: click.Context, commands_file: str, output_dir: str, forma
 @click.option("--format", "-f", type=click.Choice(["python", "json"]), default="python", help="Output format")
 @click.option("--compare", is_flag=True, help="Compare with existing database and show differences")
 @click.option("--update-existing", is_flag=True, help="Update existing database with missing commands")
+@click.option("--emit-python", is_flag=True,
+              help="With --update-existing, also write the entries as Python source for permissions_db.py")
 @click.pass_context
-def scrape_docs(ctx: click.Context, services: tuple, output: str, format: str, compare: bool, update_existing: bool) -> None:
+def scrape_docs(ctx: click.Context, services: tuple, output: str, format: str, compare: bool,
+                update_existing: bool, emit_python: bool) -> None:
     """
     Scrape AWS CLI documentation to build comprehensive permissions database.
     
@@ -250,6 +373,9 @@ def scrape_docs(ctx: click.Context, services: tuple, output: str, format: str, c
         
         # Update existing database with missing commands
         iam-generator scrape-docs --update-existing
+        
+        # ...and also emit them as Python source to paste into permissions_db.py
+        iam-generator scrape-docs --update-existing --emit-python
     """
     import logging
     
@@ -275,25 +401,16 @@ def scrape_docs(ctx: click.Context, services: tuple, output: str, format: str, c
                 # Display comparison results
                 console.print("\n[bold green]Database Comparison Results:[/bold green]")
                 
-                if comparison["missing_services"]:
-                    console.print(f"\n[yellow]Missing Services ({len(comparison['missing_services'])}):[/yellow]")
-                    for service in comparison["missing_services"]:
-                        console.print(f"  • {service}")
-                
-                if comparison["missing_commands"]:
-                    console.print(f"\n[yellow]Missing Commands ({len(comparison['missing_commands'])}):[/yellow]")
-                    for command in comparison["missing_commands"]:
-                        console.print(f"  • {command}")
-                
-                if comparison["new_services"]:
-                    console.print(f"\n[green]Manual Services ({len(comparison['new_services'])}):[/green]")
-                    for service in comparison["new_services"]:
-                        console.print(f"  • {service}")
-                
-                if comparison["new_commands"]:
-                    console.print(f"\n[green]Manual Commands ({len(comparison['new_commands'])}):[/green]")
-                    for command in comparison["new_commands"]:
-                        console.print(f"  • {command}")
+                # Render each section as one block rather than a print per entry
+                for key, title, style in (
+                    ("missing_services", "Missing Services", "yellow"),
+                    ("missing_commands", "Missing Commands", "yellow"),
+                    ("new_services", "Manual Services", "green"),
+                    ("new_commands", "Manual Commands", "green"),
+                ):
+                    if comparison[key]:
+                        console.print(f"\n[{style}]{title} ({len(comparison[key])}):[/{style}]")
+                        console.print(_bullet_list(comparison[key]))
                 
                 if not any(comparison.values()):
                     console.print("[green]✓ Databases are in sync![/green]")
@@ -319,41 +436,54 @@ def scrape_docs(ctx: click.Context, services: tuple, output: str, format: str, c
                     console.print(f"Found {len(comparison['missing_commands'])} missing commands")
                     
                     # Generate permissions for missing commands only
-                    missing_services = set()
-                    for cmd in comparison["missing_commands"]:
-                        service, command = cmd.split(":", 1)
-                        missing_services.add(service)
+                    missing_services = {cmd.partition(":")[0] for cmd in comparison["missing_commands"]}
                     
                     # Scrape only the services with missing commands
                     generated_db = scraper.generate_permissions_database(list(missing_services))
                     
-                    # Create update entries
-                    update_content = "\n# Missing commands found by doc_scraper:\n"
+                    missing_db = {}
                     for cmd in comparison["missing_commands"]:
-                        service, command = cmd.split(":", 1)
-                        if service in generated_db and command in generated_db[service]:
-                            command_perms = generated_db[service][command]
-                            update_content += f'    # {service}:{command}\n'
-                            update_content += f'    "{command}": CommandPermissions(\n'
-                            update_content += f'        service="{command_perms.service}",\n'
-                            update_content += f'        action="{command_perms.action}",\n'
-                            update_content += f'        permissions=[\n'
-                            
-                            for perm in command_perms.permissions:
-                                update_content += f'            IAMPermission(action="{perm.action}", resource="{perm.resource}"),\n'
-                            
-                            update_content += f'        ],\n'
-                            update_content += f'        description="{command_perms.description}",\n'
-                            update_content += f'        resource_patterns={command_perms.resource_patterns}\n'
-                            update_content += f'    ),\n'
+                        service, _, command = cmd.partition(":")
+                        command_perms = generated_db.get(service, {}).get(command)
+                        if command_perms is not None:
+                            missing_db.setdefault(service, {})[command] = command_perms
                     
-                    # Save update as separate file
-                    update_file = "missing_commands_update.py"
-                    with open(update_file, 'w') as f:
-                        f.write(update_content)
+                    # Save the entries as data, mergeable in one call with
+                    # IAMPermissionsDatabase.load_permissions_file
+                    update_json_file = "missing_commands_update.json"
+                    scraper.save_database_to_json(missing_db, update_json_file)
+                    console.print(f"[green]✓ Missing commands saved to {update_json_file}[/green]")
+                    console.print("[yellow]Load them with IAMPermissionsDatabase.load_permissions_file()[/yellow]")
                     
-                    console.print(f"[green]✓ Missing commands saved to {update_file}[/green]")
-                    console.print("[yellow]You can manually add these to your permissions_db.py[/yellow]")
+                    if emit_python:
+                        # Create update entries; collected in a list and joined once
+                        parts = ["\n# Missing commands found by doc_scraper:\n"]
+                        append = parts.append
+                        render_command = _MISSING_COMMAND_TEMPLATE.format
+                        render_permission = _MISSING_PERMISSION_TEMPLATE.format
+                        for service, commands in missing_db.items():
+                            for command, command_perms in commands.items():
+                                append(render_command(
+                                    service_name=service,
+                                    command_name=command,
+                                    command=_py_str(command),
+                                    service=_py_str(command_perms.service),
+                                    action=_py_str(command_perms.action),
+                                    permissions="".join(
+                                        render_permission(action=_py_str(perm.action), resource=_py_str(perm.resource))
+                                        for perm in command_perms.permissions
+                                    ),
+                                    description=_py_str(command_perms.description),
+                                    resource_patterns=command_perms.resource_patterns
+                                ))
+                        
+                        # Save update as separate file
+                        update_file = "missing_commands_update.py"
+                        with open(update_file, 'w') as f:
+                            f.write("".join(parts))
+                        
+                        console.print(f"[green]✓ Python entries saved to {update_file}[/green]")
+                        console.print("[yellow]You can manually add these to your permissions_db.py[/yellow]")
                 
                 else:
                     console.print("[green]✓ No missing commands found![/green]")
@@ -373,21 +503,7 @@ def scrape_docs(ctx: click.Context, services: tuple, output: str, format: str, c
                 scraper.save_database_to_file(database, output)
                 console.print(f"[green]✓ Generated database saved to {output}[/green]")
             else:  # json format
-                import json
-                json_data = {}
-                for service, commands in database.items():
-                    json_data[service] = {}
-                    for cmd_name, cmd_perms in commands.items():
-                        json_data[service][cmd_name] = {
-                            "service": cmd_perms.service,
-                            "action": cmd_perms.action,
-                            "permissions": [{"action": p.action, "resource": p.resource} for p in cmd_perms.permissions],
-                            "description": cmd_perms.description,
-                            "resource_patterns": cmd_perms.resource_patterns
-                        }
-                
-                with open(output, 'w') as f:
-                    json.dump(json_data, f, indent=2)
+                scraper.save_database_to_json(database, output)
                 console.print(f"[green]✓ Generated database saved to {output}[/green]")
             
             # Show statistics
@@ -429,9 +545,12 @@ def list_services(ctx: click.Context, missing_only: bool) -> None:
                 existing_db = existing_db_instance._permissions_map
                 missing_services = [s for s in available_services if s not in existing_db]
                 
+                if not console.is_terminal:
+                    click.echo("\n".join(sorted(missing_services)))
+                    return
+                
                 console.print(f"[bold yellow]Missing Services ({len(missing_services)}):[/bold yellow]")
-                for service in sorted(missing_services):
-                    console.print(f"  • {service}")
+                console.print(_bullet_list(sorted(missing_services)))
                     
             except ImportError:
                 console.print("[red]Error: Could not import existing database[/red]")
@@ -445,30 +564,45 @@ def list_services(ctx: click.Context, missing_only: bool) -> None:
                 existing_db_instance = IAMPermissionsDatabase()
                 existing_db = existing_db_instance._permissions_map
                 
+                # Count supported services while collecting the rows rather
+                # than rescanning the list for the summary
+                rows = []
+                supported = 0
+                for service in sorted(available_services):
+                    commands = existing_db.get(service)
+                    if commands is not None:
+                        supported += 1
+                        rows.append((service, "✓ Supported", str(len(commands))))
+                    else:
+                        rows.append((service, "⚠ Missing", "0"))
+                
+                if not console.is_terminal:
+                    # Piped output: plain tab-separated rows, no Rich layout
+                    click.echo("\n".join("\t".join(row) for row in rows))
+                    return
+                
                 table = Table(title="AWS Services Coverage")
                 table.add_column("Service", style="cyan")
                 table.add_column("Status", style="green")
                 table.add_column("Commands", justify="right")
+                for row in rows:
+                    table.add_row(*row)
                 
-                for service in sorted(available_services):
-                    if service in existing_db:
-                        command_count = len(existing_db[service])
-                        table.add_row(service, "✓ Supported", str(command_count))
-                    else:
-                        table.add_row(service, "⚠ Missing", "0")
-                
-                console.print(table)
+                # Page the table when it would scroll past one screen
+                if len(rows) > console.height:
+                    with console.pager(styles=True):
+                        console.print(table)
+                else:
+                    console.print(table)
                 
                 # Show summary
-                supported = len([s for s in available_services if s in existing_db])
                 total = len(available_services)
                 console.print(f"\n[bold]Summary:[/bold] {supported}/{total} services supported ({supported/total*100:.1f}%)")
                 
             except ImportError:
                 # Show without coverage information
                 console.print("[bold blue]Available AWS Services:[/bold blue]")
-                for service in sorted(available_services):
-                    console.print(f"  • {service}")
+                console.print(_bullet_list(sorted(available_services)))
                 console.print(f"\nTotal: {len(available_services)} services")
     
     except Exception as e:
@@ -492,7 +626,7 @@ def show_stats(ctx: click.Context, format: str, save: Optional[str]) -> None:
         console.print("[blue]Getting auto-discovery statistics...[/blue]")
     
     try:
-        analyzer = IAMPermissionAnalyzer(enable_auto_discovery=True)
+        analyzer = _get_analyzer(enable_auto_discovery=True)
         stats = analyzer.get_auto_discovery_stats()
         
         if format == "table":
@@ -509,6 +643,11 @@ def show_stats(ctx: click.Context, format: str, save: Optional[str]) -> None:
         sys.exit(1)
 
 
+def _bullet_list(items: List[str]) -> str:
+    """Format items as one bulleted block so it is rendered with a single print."""
+    return "\n".join(f"  • {item}" for item in items)
+
+
 def _display_stats_table(stats: Dict[str, Any]) -> None:
     """Display statistics in table format."""
     
@@ -587,21 +726,17 @@ def _display_stats_table(stats: Dict[str, Any]) -> None:
 
 def _display_stats_json(stats: Dict[str, Any]) -> None:
     """Display statistics in JSON format."""
-    json_output = json.dumps(stats, indent=2)
-    syntax = Syntax(json_output, "json", theme="monokai")
-    console.print(syntax)
+    _print_code(_json_text(stats), "json")
 
 
 def _save_stats(stats: Dict[str, Any], filepath: str, format: str) -> None:
     """Save statistics to file."""
-    with open(filepath, "w") as f:
-        if format == "json":
-            json.dump(stats, f, indent=2)
-        else:  # table format as text
-            f.write("Auto-Discovery System Statistics\n")
-            f.write("================================\n\n")
-            for key, value in stats.items():
-                f.write(f"{key}: {value}\n")
+    if format == "json":
+        _write_json(filepath, stats)
+    else:  # table format as text
+        lines = ["Auto-Discovery System Statistics", "================================", ""]
+        lines.extend(f"{key}: {value}" for key, value in stats.items())
+        Path(filepath).write_text("\n".join(lines) + "\n")
 
 
 def _display_table_output(result: Dict[str, Any]) -> None:
@@ -616,7 +751,15 @@ def _display_table_output(result: Dict[str, Any]) -> None:
     ))
     
     # Required permissions table
-    if result['required_permissions']:
+    if len(result['required_permissions']) > _TABLE_MAX_ROWS:
+        # Rich measures every cell to lay out a table; for large policies
+        # print fixed-width columns instead
+        rows = [(perm['action'], perm.get('resource', '*')) for perm in result['required_permissions']]
+        width = max(len("Permission"), max(len(action) for action, _ in rows))
+        lines = ["Required IAM Permissions", f"{'Permission':<{width}}  Resource"]
+        lines.extend(f"{action:<{width}}  {resource}" for action, resource in rows)
+        click.echo("\n".join(lines))
+    elif result['required_permissions']:
         table = Table(title="Required IAM Permissions")
         table.add_column("Permission", style="cyan")
         table.add_column("Resource", style="magenta")
@@ -644,44 +787,59 @@ def _display_table_output(result: Dict[str, Any]) -> None:
     
     # Generated policy document
     if result.get('policy_document'):
-        policy_json = json.dumps(result['policy_document'], indent=2)
+        policy_json = _json_text(result['policy_document'])
+        from rich.syntax import Syntax
         syntax = Syntax(policy_json, "json", theme="monokai")
         console.print(Panel(syntax, title="Generated IAM Policy", border_style="green"))
 
 
-def _display_json_output(result: Dict[str, Any]) -> None:
-    """Display analysis result in JSON format."""
-    json_output = json.dumps(result, indent=2)
-    syntax = Syntax(json_output, "json", theme="monokai")
-    console.print(syntax)
+def _display_json_output(result: Dict[str, Any]) -> str:
+    """Display analysis result in JSON format, returning the displayed text."""
+    json_output = _json_text(result)
+    _print_code(json_output, "json")
+    return json_output
 
 
-def _display_yaml_output(result: Dict[str, Any]) -> None:
-    """Display analysis result in YAML format."""
-    import yaml
-    yaml_output = yaml.dump(result, default_flow_style=False)
-    syntax = Syntax(yaml_output, "yaml", theme="monokai")
-    console.print(syntax)
-
-
-def _save_output(result: Dict[str, Any], filepath: str, format: str) -> None:
-    """Save analysis result to file."""
-    with open(filepath, "w") as f:
-        if format == "json":
-            json.dump(result, f, indent=2)
-        elif format == "yaml":
-            import yaml
-            yaml.dump(result, f, default_flow_style=False)
-        else:  # table format as text
-            f.write(f"Service: {result['service']}\n")
-            f.write(f"Action: {result['action']}\n")
-            f.write(f"Command: {result['original_command']}\n\n")
-            f.write("Required Permissions:\n")
-            for perm in result['required_permissions']:
-                f.write(f"  - {perm['action']} on {perm.get('resource', '*')}\n")
-            if result.get('policy_document'):
-                f.write("\nGenerated Policy:\n")
-                f.write(json.dumps(result['policy_document'], indent=2))
+def _display_yaml_output(result: Dict[str, Any]) -> str:
+    """Display analysis result in YAML format, returning the displayed text."""
+    yaml_output = _yaml_text(result)
+    _print_code(yaml_output, "yaml")
+    return yaml_output
+
+
+def _save_output(result: Dict[str, Any], filepath: str, format: str,
+                 rendered: Optional[str] = None) -> None:
+    """
+    Save analysis result to file.
+    
+    rendered is the JSON or YAML text already produced for display, if any,
+    so the result is not serialized a second time.
+    """
+    if format == "json":
+        if rendered is None:
+            _write_json(filepath, result)
+        else:
+            Path(filepath).write_bytes(rendered.encode())
+        return
+    
+    if format == "yaml":
+        content = rendered if rendered is not None else _yaml_text(result)
+    else:  # table format as text
+        parts = [
+            f"Service: {result['service']}\n",
+            f"Action: {result['action']}\n",
+            f"Command: {result['original_command']}\n\n",
+            "Required Permissions:\n",
+        ]
+        parts.extend(f"  - {perm['action']} on {perm.get('resource', '*')}\n"
+                     for perm in result['required_permissions'])
+        if result.get('policy_document'):
+            parts.append("\nGenerated Policy:\n")
+            parts.append(_json_text(result['policy_document']))
+        content = "".join(parts)
+    
+    # Written in one call rather than line by line through a text stream
+    Path(filepath).write_text(content)
 
 
 if __name__ == "__main__":
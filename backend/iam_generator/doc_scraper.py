@@ -5,27 +5,73 @@ This module automatically discovers AWS CLI commands and maps them to IAM permis
 by scraping AWS CLI help documentation and applying intelligent mapping rules.
 """
 
+import hashlib
+import io
 import subprocess
 import re
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Set, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 import logging
 
 try:
-    from .permissions_db import IAMPermission, CommandPermissions
+    from .permissions_db import IAMPermission, CommandPermissions, _DATABASE_ADAPTER
 except ImportError:
     # Handle relative import issues
     import sys
     sys.path.append(str(Path(__file__).parent))
-    from permissions_db import IAMPermission, CommandPermissions
+    from permissions_db import IAMPermission, CommandPermissions, _DATABASE_ADAPTER
 
 logger = logging.getLogger(__name__)
 
+# Concurrent `aws <service> help` subprocesses; discovery is I/O bound
+MAX_DISCOVERY_WORKERS = 8
+
+# Preamble of the Python module written by save_database_to_file
+_GENERATED_DB_HEADER = '''"""
+Auto-generated AWS CLI permissions database.
+Generated by doc_scraper.py
+"""
+
+from .permissions_db import IAMPermission, CommandPermissions
+
+# Auto-generated permissions database
+GENERATED_PERMISSIONS_DB = {
+'''
+
+# One template per generated command entry and per permission line, so each
+# entry is formatted in a single call instead of field by field. String fields
+# are substituted already quoted by _py_str.
+_COMMAND_TEMPLATE = '''        {command}: CommandPermissions(
+            service={service},
+            action={action},
+            permissions=[
+{permissions}            ],
+            description={description},
+            resource_patterns={resource_patterns}
+        ),
+'''
+
+_PERMISSION_TEMPLATE = '''                IAMPermission(action={action}, resource={resource}),
+'''
+
+
+def _py_str(value: str) -> str:
+    """Quote a value as a Python string literal.
+    
+    JSON string syntax is a subset of Python's, so json.dumps escapes quotes,
+    backslashes and control characters correctly and leaves ordinary values
+    in the same double-quoted form the generated module has always used.
+    """
+    return json.dumps(value)
+
 @dataclass
 class CommandInfo:
     """Information about an AWS CLI command."""
+    __slots__ = ("service", "command", "description", "confidence")
+    
     service: str
     command: str
     description: str
@@ -34,6 +80,8 @@ class CommandInfo:
 @dataclass
 class ServiceInfo:
     """Information about an AWS service."""
+    __slots__ = ("name", "description", "commands")
+    
     name: str
     description: str
     commands: List[CommandInfo]
@@ -41,8 +89,14 @@ class ServiceInfo:
 class AWSCLIDocumentationScraper:
     """Scrapes AWS CLI documentation to build comprehensive permissions database."""
     
-    def __init__(self):
+    def __init__(self, help_cache_dir: Optional[str] = None):
         self.services: Dict[str, ServiceInfo] = {}
+        # Raw `aws ... help` pages are persisted here so repeated runs skip the CLI
+        self.help_cache_dir = Path(help_cache_dir) if help_cache_dir else None
+        # Successful help pages already fetched by this scraper, keyed by command line
+        self._help_pages: Dict[Tuple[str, ...], subprocess.CompletedProcess] = {}
+        # Interned wildcard-resource permissions, shared across generated commands
+        self._star_permissions: Dict[str, IAMPermission] = {}
         self.permission_mapping_rules = self._load_mapping_rules()
         self.special_cases = self._load_special_cases()
         
@@ -137,19 +191,43 @@ class AWSCLIDocumentationScraper:
             }
         }
     
+    def _run_help(self, *args: str) -> subprocess.CompletedProcess:
+        """Run `aws <args> help`, serving the page from memory or help_cache_dir when present."""
+        cached = self._help_pages.get(args)
+        if cached is not None:
+            return cached
+        
+        cmd = ["aws", *args, "help"]
+        cache_path = None
+        
+        if self.help_cache_dir is not None:
+            key = hashlib.blake2b(" ".join(cmd).encode("utf-8"), digest_size=16).hexdigest()
+            cache_path = self.help_cache_dir / f"{key}.txt"
+            if cache_path.exists():
+                result = subprocess.CompletedProcess(cmd, 0, cache_path.read_text(), "")
+                self._help_pages[args] = result
+                return result
+        
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        
+        if result.returncode == 0:
+            self._help_pages[args] = result
+            if cache_path is not None:
+                try:
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    cache_path.write_text(result.stdout)
+                except OSError as e:
+                    logger.warning("Failed to cache help page %s: %s", cache_path, e)
+        return result
+    
     def discover_services(self) -> List[str]:
         """Discover all available AWS services from CLI help."""
         try:
             logger.info("Discovering AWS services...")
-            result = subprocess.run(
-                ["aws", "help"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            result = self._run_help()
             
             if result.returncode != 0:
-                logger.error(f"Failed to get AWS help: {result.stderr}")
+                logger.error("Failed to get AWS help: %s", result.stderr)
                 return []
             
             # Parse the help output to extract service names
@@ -178,29 +256,24 @@ class AWSCLIDocumentationScraper:
                         if service_name not in ['help', 'configure']:  # Skip utility commands
                             services.append(service_name)
             
-            logger.info(f"Discovered {len(services)} AWS services")
+            logger.info("Discovered %s AWS services", len(services))
             return services
             
         except subprocess.TimeoutExpired:
             logger.error("Timeout while discovering AWS services")
             return []
         except Exception as e:
-            logger.error(f"Error discovering AWS services: {e}")
+            logger.error("Error discovering AWS services: %s", e)
             return []
     
     def discover_commands(self, service: str) -> List[CommandInfo]:
         """Discover all commands for a specific AWS service."""
         try:
-            logger.info(f"Discovering commands for service: {service}")
-            result = subprocess.run(
-                ["aws", service, "help"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            logger.info("Discovering commands for service: %s", service)
+            result = self._run_help(service)
             
             if result.returncode != 0:
-                logger.warning(f"Failed to get help for service {service}: {result.stderr}")
+                logger.warning("Failed to get help for service %s: %s", service, result.stderr)
                 return []
             
             # Parse the help output to extract command names
@@ -238,16 +311,28 @@ class AWSCLIDocumentationScraper:
                                 confidence='medium'  # Default confidence
                             ))
             
-            logger.info(f"Discovered {len(commands)} commands for {service}")
+            logger.info("Discovered %s commands for %s", len(commands), service)
             return commands
             
         except subprocess.TimeoutExpired:
-            logger.warning(f"Timeout while discovering commands for {service}")
+            logger.warning("Timeout while discovering commands for %s", service)
             return []
         except Exception as e:
-            logger.warning(f"Error discovering commands for {service}: {e}")
+            logger.warning("Error discovering commands for %s: %s", service, e)
             return []
     
+    def discover_service_commands(self, service: str) -> Tuple[List[str], List[CommandInfo]]:
+        """Discover all services and the commands of one service concurrently.
+        
+        The two help pages are independent, so the service's page is fetched
+        alongside the service list rather than after it. Callers still check
+        the service list before trusting the commands.
+        """
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            commands = pool.submit(self.discover_commands, service)
+            services = self.discover_services()
+            return services, commands.result()
+    
     def _convert_command_to_action(self, command: str) -> str:
         """Convert a CLI command name to IAM action format."""
         # Split on hyphens and convert to PascalCase
@@ -308,6 +393,13 @@ class AWSCLIDocumentationScraper:
         service_patterns = self.special_cases.get("resource_patterns", {})
         return service_patterns.get(service, ["*"])
     
+    def _star_permission(self, action: str) -> IAMPermission:
+        """Return the shared IAMPermission for action on resource "*"."""
+        perm = self._star_permissions.get(action)
+        if perm is None:
+            perm = self._star_permissions.setdefault(action, IAMPermission(action=action, resource="*"))
+        return perm
+    
     def map_command_to_permissions(self, service: str, command: str) -> CommandPermissions:
         """Map a CLI command to IAM permissions."""
         # Get base permissions
@@ -316,28 +408,16 @@ class AWSCLIDocumentationScraper:
         # Get additional permissions
         additional_permissions = self._get_additional_permissions(service, command, base_permissions)
         
-        # Combine all permissions
-        all_permissions = base_permissions + additional_permissions
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_permissions = []
-        for perm in all_permissions:
-            if perm not in seen:
-                seen.add(perm)
-                unique_permissions.append(perm)
-        
-        # Convert to IAMPermission objects
-        iam_permissions = []
-        for perm in unique_permissions:
-            iam_permissions.append(IAMPermission(action=perm, resource="*"))
+        # Combine, de-duplicate (preserving order) and convert in one pass;
+        # actions repeated across commands (e.g. "ec2:Describe*") reuse one object
+        iam_permissions = [
+            self._star_permission(perm)
+            for perm in dict.fromkeys(base_permissions + additional_permissions)
+        ]
         
         # Get resource patterns
         resource_patterns = self._get_resource_patterns(service, command)
         
-        # Determine confidence level
-        confidence = self._determine_confidence(service, command)
-        
         return CommandPermissions(
             service=service,
             action=command,
@@ -366,15 +446,20 @@ class AWSCLIDocumentationScraper:
         # Low confidence for unknown patterns
         return "low"
     
-    def scrape_all_services(self, services: Optional[List[str]] = None) -> Dict[str, ServiceInfo]:
+    def scrape_all_services(self, services: Optional[List[str]] = None,
+                            max_workers: int = MAX_DISCOVERY_WORKERS) -> Dict[str, ServiceInfo]:
         """Scrape all AWS services and their commands."""
         if services is None:
             services = self.discover_services()
         
-        logger.info(f"Scraping {len(services)} AWS services...")
+        logger.info("Scraping %s AWS services...", len(services))
         
-        for service in services:
-            commands = self.discover_commands(service)
+        # Each service is a separate help subprocess, so run them concurrently;
+        # map() keeps results in service order
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(services)))) as pool:
+            discovered = list(pool.map(self.discover_commands, services))
+        
+        for service, commands in zip(services, discovered):
             if commands:
                 self.services[service] = ServiceInfo(
                     name=service,
@@ -382,7 +467,7 @@ class AWSCLIDocumentationScraper:
                     commands=commands
                 )
         
-        logger.info(f"Successfully scraped {len(self.services)} services")
+        logger.info("Successfully scraped %s services", len(self.services))
         return self.services
     
     def generate_permissions_database(self, services: Optional[List[str]] = None) -> Dict[str, Dict[str, CommandPermissions]]:
@@ -404,50 +489,51 @@ class AWSCLIDocumentationScraper:
                 )
                 database[service_name][command_info.command] = command_permissions
         
-        logger.info(f"Generated database with {len(database)} services")
+        logger.info("Generated database with %s services", len(database))
         return database
     
     def save_database_to_file(self, database: Dict, output_file: str):
         """Save the generated database to a Python file."""
-        logger.info(f"Saving database to {output_file}")
+        logger.info("Saving database to %s", output_file)
         
-        # Generate Python code for the database
-        content = '''"""
-Auto-generated AWS CLI permissions database.
-Generated by doc_scraper.py
-"""
-
-from .permissions_db import IAMPermission, CommandPermissions
-
-# Auto-generated permissions database
-GENERATED_PERMISSIONS_DB = {
-'''
+        # Generate Python code for the database into one buffer rather than
+        # growing an immutable string line by line
+        buf = io.StringIO()
+        w = buf.write
+        w(_GENERATED_DB_HEADER)
+        render_command = _COMMAND_TEMPLATE.format
+        render_permission = _PERMISSION_TEMPLATE.format
         
         for service_name, commands in database.items():
-            content += f'    "{service_name}": {{\n'
+            w(f'    {_py_str(service_name)}: {{\n')
             
             for command_name, command_perms in commands.items():
-                content += f'        "{command_name}": CommandPermissions(\n'
-                content += f'            service="{command_perms.service}",\n'
-                content += f'            action="{command_perms.action}",\n'
-                content += f'            permissions=[\n'
-                
-                for perm in command_perms.permissions:
-                    content += f'                IAMPermission(action="{perm.action}", resource="{perm.resource}"),\n'
-                
-                content += f'            ],\n'
-                content += f'            description="{command_perms.description}",\n'
-                content += f'            resource_patterns={command_perms.resource_patterns}\n'
-                content += f'        ),\n'
+                w(render_command(
+                    command=_py_str(command_name),
+                    service=_py_str(command_perms.service),
+                    action=_py_str(command_perms.action),
+                    permissions="".join(
+                        render_permission(action=_py_str(perm.action), resource=_py_str(perm.resource))
+                        for perm in command_perms.permissions
+                    ),
+                    description=_py_str(command_perms.description),
+                    resource_patterns=command_perms.resource_patterns
+                ))
             
-            content += f'    }},\n'
+            w('    },\n')
         
-        content += '}\n'
+        w('}\n')
         
         with open(output_file, 'w') as f:
-            f.write(content)
+            f.write(buf.getvalue())
         
-        logger.info(f"Database saved to {output_file}")
+        logger.info("Database saved to %s", output_file)
+    
+    def save_database_to_json(self, database: Dict, output_file: str):
+        """Save the generated database as JSON, one object per CommandPermissions."""
+        logger.info("Saving database to %s", output_file)
+        Path(output_file).write_bytes(_DATABASE_ADAPTER.dump_json(database, indent=2))
+        logger.info("Database saved to %s", output_file)
     
     def compare_with_existing(self, existing_db: Dict, services: Optional[List[str]] = None) -> Dict[str, List[str]]:
         """Compare generated database with existing database."""
@@ -460,29 +546,19 @@ GENERATED_PERMISSIONS_DB = {
         
         generated_db = self.generate_permissions_database(services)
         
-        # Find missing services in existing DB
-        for service in generated_db.keys():
-            if service not in existing_db:
-                comparison["missing_services"].append(service)
-        
-        # Find new services in generated DB
-        for service in existing_db.keys():
-            if service not in generated_db:
-                comparison["new_services"].append(service)
-        
-        # Find missing commands
-        for service, commands in generated_db.items():
-            if service in existing_db:
-                for command in commands.keys():
-                    if command not in existing_db[service]:
-                        comparison["missing_commands"].append(f"{service}:{command}")
-        
-        # Find new commands in existing DB
-        for service, commands in existing_db.items():
-            if service in generated_db:
-                for command in commands.keys():
-                    if command not in generated_db[service]:
-                        comparison["new_commands"].append(f"{service}:{command}")
+        # Services only in the generated DB, and services only in the existing DB
+        comparison["missing_services"] = [s for s in generated_db if s not in existing_db]
+        comparison["new_services"] = [s for s in existing_db if s not in generated_db]
+        
+        # Flatten both sides to (service, command) rows for the shared services,
+        # then diff the rows in one flat pass each
+        generated_rows = [(s, c) for s, commands in generated_db.items() if s in existing_db for c in commands]
+        existing_rows = [(s, c) for s, commands in existing_db.items() if s in generated_db for c in commands]
+        generated_set = set(generated_rows)
+        existing_set = set(existing_rows)
+        
+        comparison["missing_commands"] = [f"{s}:{c}" for s, c in generated_rows if (s, c) not in existing_set]
+        comparison["new_commands"] = [f"{s}:{c}" for s, c in existing_rows if (s, c) not in generated_set]
         
         return comparison
 
@@ -495,11 +571,12 @@ def main():
     parser.add_argument("--services", nargs="+", help="Specific services to scrape")
     parser.add_argument("--output", default="generated_permissions_db.py", help="Output file")
     parser.add_argument("--compare", action="store_true", help="Compare with existing database")
+    parser.add_argument("--help-cache", help="Directory to cache `aws ... help` pages between runs")
     args = parser.parse_args()
     
     logging.basicConfig(level=logging.INFO)
     
-    scraper = AWSCLIDocumentationScraper()
+    scraper = AWSCLIDocumentationScraper(help_cache_dir=args.help_cache)
     
     if args.compare:
         # Import existing database for comparison
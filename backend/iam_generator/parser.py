@@ -7,7 +7,7 @@ extracting service names, actions, and parameters.
 
 import re
 import shlex
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from pydantic import BaseModel, Field
 
@@ -33,6 +33,7 @@ class AWSCLIParser:
     # Common AWS CLI patterns
     AWS_CLI_PATTERN = re.compile(r'^aws\s+([a-z0-9-]+)\s+([a-z0-9-]+)(?:\s+(.*))?$', re.IGNORECASE)
     AWS_CLI_NO_PREFIX_PATTERN = re.compile(r'^([a-z0-9-]+)\s+([a-z0-9-]+)(?:\s+(.*))?$', re.IGNORECASE)
+    AWS_PREFIX_PATTERN = re.compile(r'^aws2?\s+', re.IGNORECASE)
     ARN_PATTERN = re.compile(r'arn:aws:[a-z0-9-]+:[a-z0-9-]*:[a-z0-9]*:[a-z0-9-/\*\.]+', re.IGNORECASE)
     
     # Service aliases mapping
@@ -106,6 +107,27 @@ class AWSCLIParser:
             raw_command=command
         )
     
+    @classmethod
+    def normalize_commands(cls, raw_commands: Iterable[str]) -> List[str]:
+        """
+        Clean up a batch of commands in a single pass.
+        
+        Strips whitespace, drops blank lines and '#' comments, and rewrites
+        any 'aws'/'aws2' prefix (or a missing one) to a single 'aws '.
+        
+        Args:
+            raw_commands: Raw command lines (e.g. from a file or a paste)
+            
+        Returns:
+            List of normalized AWS CLI command strings
+        """
+        strip_prefix = cls.AWS_PREFIX_PATTERN.sub
+        return [
+            "aws " + strip_prefix("", command, count=1)
+            for command in map(str.strip, raw_commands)
+            if command and command[0] != "#"
+        ]
+    
     def _is_valid_aws_command_format(self, service: str, action: str, original_command: str) -> bool:
         """
         Validate if the command follows AWS CLI naming conventions.
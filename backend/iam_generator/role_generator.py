@@ -5,14 +5,264 @@ This module provides functionality to generate IAM roles and policies
 based on the analyzed permissions from AWS CLI commands.
 """
 
+import hashlib
 import json
+import sys
+import threading
+from collections import OrderedDict
+from string import Template
 from typing import Dict, List, Optional, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .analyzer import AnalysisResult, IAMPermissionAnalyzer
 
 
+# Shell script templates for the AWS CLI emitters. Everything except the
+# optional tag section is static, so each script is a single format() call.
+_CLI_TEMPLATE = """\
+# Save trust policy to file
+cat > trust-policy.json << 'EOF'
+{trust_policy}
+EOF
+
+# Save permissions policy to file
+cat > {policy_file}-policy.json << 'EOF'
+{policy_document}
+EOF
+
+aws iam create-role --role-name {role_name} --assume-role-policy-document file://trust-policy.json --description '{role_description}' --path {role_path} --max-session-duration {max_session_duration}
+aws iam create-policy --policy-name {policy_name} --policy-document file://{policy_file}-policy.json --description '{policy_description}' --path {policy_path}
+aws iam attach-role-policy --role-name {role_name} --policy-arn arn:aws:iam::$(aws sts get-caller-identity --query Account --output text):policy{policy_path}{policy_name}
+
+# Create instance profile for EC2 (optional)
+aws iam create-instance-profile --instance-profile-name {role_name}-profile
+aws iam add-role-to-instance-profile --instance-profile-name {role_name}-profile --role-name {role_name}"""
+
+_AWS_CLI_TEMPLATE = """\
+# Create IAM role {role_name}
+
+# Create trust policy file
+cat > trust-policy.json << 'EOF'
+{trust_policy}
+EOF
+
+# Create permissions policy file
+cat > permissions-policy.json << 'EOF'
+{policy_document}
+EOF
+
+# Create the IAM role
+aws iam create-role --role-name {role_name} --assume-role-policy-document file://trust-policy.json --description '{description}'
+
+# Create the IAM policy
+aws iam create-policy --policy-name {role_name}_policy --policy-document file://permissions-policy.json --description 'Policy for {role_name}'
+
+# Attach policy to role
+aws iam attach-role-policy --role-name {role_name} --policy-arn arn:aws:iam::ACCOUNT_ID:policy/{role_name}_policy
+
+# Clean up temporary files
+rm trust-policy.json permissions-policy.json"""
+
+
+# Terraform templates, compiled once at import. HCL is brace-heavy, so these
+# use $-placeholders rather than str.format fields.
+_TERRAFORM_TEMPLATE = Template("""\
+# IAM Role and Policy Configuration
+# Generated by IAM Generator
+
+resource "aws_iam_role" "$role_name" {
+  name               = "$role_name"
+  description        = "$role_description"
+  path               = "$role_path"
+  max_session_duration = $max_session_duration
+  
+  assume_role_policy = jsonencode($trust_policy)
+  
+  tags = {
+$role_tags
+  }
+}
+
+resource "aws_iam_policy" "$policy_name" {
+  name        = "$policy_name"
+  description = "$policy_description"
+  path        = "$policy_path"
+  
+  policy = jsonencode($policy_document)
+  
+  tags = {
+$policy_tags
+  }
+}
+
+resource "aws_iam_role_policy_attachment" "${role_name}_policy_attachment" {
+  role       = aws_iam_role.$role_name.name
+  policy_arn = aws_iam_policy.$policy_name.arn
+}
+
+# Instance Profile (if needed for EC2)
+resource "aws_iam_instance_profile" "${role_name}_profile" {
+  name = "$role_name-profile"
+  role = aws_iam_role.$role_name.name
+}
+
+# Outputs
+output "${role_name}_arn" {
+  description = "ARN of the IAM role"
+  value       = aws_iam_role.$role_name.arn
+}
+
+output "${policy_name}_arn" {
+  description = "ARN of the IAM policy"
+  value       = aws_iam_policy.$policy_name.arn
+}
+""")
+
+_TERRAFORM_CONFIG_TEMPLATE = Template("""\
+# IAM Role and Policy Configuration
+# Generated by IAM Generator
+
+resource "aws_iam_role" "$tf_name" {
+  name        = "$role_name"
+  description = "$description"
+  
+  assume_role_policy = jsonencode($trust_policy)
+  
+  tags = {
+    Name      = "$role_name"
+    Generator = "IAMGenerator"
+  }
+}
+
+resource "aws_iam_policy" "${tf_name}_policy" {
+  name        = "${role_name}_policy"
+  description = "Policy for $role_name"
+  
+  policy = jsonencode($policy_document)
+  
+  tags = {
+    Name      = "${role_name}_policy"
+    Generator = "IAMGenerator"
+  }
+}
+
+resource "aws_iam_role_policy_attachment" "${tf_name}_attachment" {
+  role       = aws_iam_role.$tf_name.name
+  policy_arn = aws_iam_policy.${tf_name}_policy.arn
+}
+
+# Outputs
+output "${tf_name}_arn" {
+  description = "ARN of the IAM role"
+  value       = aws_iam_role.$tf_name.arn
+}
+
+output "${tf_name}_policy_arn" {
+  description = "ARN of the IAM policy"
+  value       = aws_iam_policy.${tf_name}_policy.arn
+}
+""")
+
+# JSON text template mirroring _generate_cloudformation_config. Values are
+# substituted pre-serialized, so the rendered text is identical to
+# json.dumps(template_dict, indent=2) without building the nested dict.
+_CFN_TEMPLATE = Template("""\
+{
+  "AWSTemplateFormatVersion": "2010-09-09",
+  "Description": $description,
+  "Resources": {
+    $role_key: {
+      "Type": "AWS::IAM::Role",
+      "Properties": {
+        "RoleName": $role_name,
+        "Description": $role_description,
+        "AssumeRolePolicyDocument": $trust_policy
+      }
+    },
+    $policy_key: {
+      "Type": "AWS::IAM::Policy",
+      "Properties": {
+        "PolicyName": $policy_name,
+        "PolicyDocument": $policy_document,
+        "Roles": [
+          {
+            "Ref": $role_key
+          }
+        ]
+      }
+    }
+  },
+  "Outputs": {
+    "RoleArn": {
+      "Description": "ARN of the created IAM role",
+      "Value": {
+        "Fn::GetAtt": [
+          $role_key,
+          "Arn"
+        ]
+      }
+    },
+    "PolicyArn": {
+      "Description": "ARN of the created IAM policy",
+      "Value": {
+        "Ref": $policy_key
+      }
+    }
+  }
+}""")
+
+
+# Policy literals shared by every trust policy builder
+_POLICY_VERSION = "2012-10-17"
+_ALLOW = "Allow"
+_ASSUME_ROLE = "sts:AssumeRole"
+
+
+def _nested_json(value: Any, depth: int) -> str:
+    """Serialize a value for embedding at the given indent depth of a JSON document."""
+    return json.dumps(value, indent=2).replace("\n", "\n" + "  " * depth)
+
+
+def _service_trust_policy(service_principal: str) -> Dict:
+    """Build a trust policy allowing an AWS service principal to assume the role."""
+    return {
+        "Version": _POLICY_VERSION,
+        "Statement": [
+            {
+                "Effect": _ALLOW,
+                "Principal": {"Service": sys.intern(service_principal)},
+                "Action": _ASSUME_ROLE
+            }
+        ]
+    }
+
+
+def _cross_account_trust_policy(account_id: Optional[str]) -> Dict:
+    """Build a trust policy allowing another account's root to assume the role."""
+    return {
+        "Version": _POLICY_VERSION,
+        "Statement": [
+            {
+                "Effect": _ALLOW,
+                "Principal": {"AWS": f"arn:aws:iam::{account_id}:root"},
+                "Action": _ASSUME_ROLE
+            }
+        ]
+    }
+
+
+# Trust policy builders keyed by trust_policy_type. Each builder takes the
+# cross-account ID (ignored by service principals) and returns a fresh dict.
+_TRUST_POLICY_BUILDERS = {
+    "default": lambda _account_id: _service_trust_policy("lambda.amazonaws.com"),
+    "ec2": lambda _account_id: _service_trust_policy("ec2.amazonaws.com"),
+    "lambda": lambda _account_id: _service_trust_policy("lambda.amazonaws.com"),
+    "ecs": lambda _account_id: _service_trust_policy("ecs-tasks.amazonaws.com"),
+    "cross-account": _cross_account_trust_policy,
+}
+
+
 class RoleConfiguration(BaseModel):
     """Configuration for IAM role generation."""
     
@@ -36,20 +286,44 @@ class PolicyConfiguration(BaseModel):
 class GeneratedRole(BaseModel):
     """Generated IAM role with policies."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     role_config: RoleConfiguration
     policy_config: PolicyConfiguration
     policy_document: Dict
     terraform_config: Optional[str] = None
     cloudformation_template: Optional[Dict] = None
-    aws_cli_commands: List[str] = Field(default_factory=list)
+    aws_cli_commands: Optional[str] = None
 
 
 class IAMRoleGenerator:
     """Generator for IAM roles and policies based on analyzed permissions."""
     
-    def __init__(self):
-        """Initialize the role generator."""
-        self.analyzer = IAMPermissionAnalyzer()
+    # Analyzer shared by all generators; building one loads the permissions
+    # database and starts the auto-discovery preloader
+    _shared_analyzer: Optional[IAMPermissionAnalyzer] = None
+    _shared_analyzer_lock = threading.Lock()
+    
+    def __init__(self, enable_cache: bool = False, cache_size: int = 256):
+        """Initialize the role generator.
+        
+        Args:
+            enable_cache: Memoize generated roles keyed by their inputs. Cached
+                results are shared between callers and must not be mutated.
+            cache_size: Maximum number of cached results (LRU eviction)
+        """
+        self.analyzer = self._get_shared_analyzer()
+        self._cache: Optional[OrderedDict] = OrderedDict() if enable_cache else None
+        self._cache_size = cache_size
+    
+    @classmethod
+    def _get_shared_analyzer(cls) -> IAMPermissionAnalyzer:
+        """Return the process-wide analyzer, creating it on first use."""
+        if IAMRoleGenerator._shared_analyzer is None:
+            with IAMRoleGenerator._shared_analyzer_lock:
+                if IAMRoleGenerator._shared_analyzer is None:
+                    IAMRoleGenerator._shared_analyzer = IAMPermissionAnalyzer()
+        return IAMRoleGenerator._shared_analyzer
     
     def generate_role(self, analysis_result: Dict = None,
                      commands: List[str] = None,
@@ -85,9 +359,21 @@ class IAMRoleGenerator:
                 cross_account_id, output_format, description, **kwargs
             )
         elif commands is not None:
+            # Identical commands always analyze to the same policy, so a cache
+            # hit skips the analyzer as well as the emitters
+            cache_key = None
+            if self._cache is not None:
+                cache_key = self._make_cache_key(
+                    "commands", list(commands), role_name, trust_policy_type,
+                    cross_account_id, output_format, description, kwargs
+                )
+                cached = self._cache_get(cache_key)
+                if cached is not None:
+                    return cached
+            
             # Called with commands (analyze first)
             analysis = self.analyze_commands_for_role(commands)
-            return self.generate_role_from_analysis(
+            result = self._build_role_from_analysis(
                 {
                     "policy_document": analysis.policy_document,
                     "services_used": analysis.services_used,
@@ -98,6 +384,9 @@ class IAMRoleGenerator:
                 },
                 role_name, trust_policy_type, cross_account_id, output_format, description, **kwargs
             )
+            if cache_key is not None:
+                self._cache_put(cache_key, result)
+            return result
         else:
             raise ValueError("Either analysis_result or commands must be provided")
     
@@ -123,15 +412,47 @@ class IAMRoleGenerator:
         Returns:
             Role configuration dictionary with all output formats
         """
+        cache_key = None
+        if self._cache is not None:
+            cache_key = self._make_cache_key(
+                "analysis", analysis_result, role_name, trust_policy_type,
+                cross_account_id, output_format, description, kwargs
+            )
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+        
+        result = self._build_role_from_analysis(
+            analysis_result, role_name, trust_policy_type,
+            cross_account_id, output_format, description, **kwargs
+        )
+        if cache_key is not None:
+            self._cache_put(cache_key, result)
+        return result
+    
+    def _build_role_from_analysis(self, analysis_result: Dict,
+                                  role_name: str,
+                                  trust_policy_type: str = "default",
+                                  cross_account_id: Optional[str] = None,
+                                  output_format: str = "json",
+                                  description: Optional[str] = None,
+                                  **kwargs) -> Dict:
+        """
+        Build the role configuration for generate_role_from_analysis, uncached.
+        
+        The commands path of generate_role calls this directly, since it
+        caches the result under its own key.
+        """
         # Validate cross-account requirements
         if trust_policy_type == "cross-account" and not cross_account_id:
             raise ValueError("Cross-account ID is required for cross-account trust policy")
             
         # Validate trust policy type
-        valid_types = ["default", "ec2", "lambda", "ecs", "cross-account"]
-        if trust_policy_type not in valid_types:
+        if trust_policy_type not in _TRUST_POLICY_BUILDERS:
             raise ValueError(f"Unsupported trust policy type: {trust_policy_type}")
         
+        policy_document = analysis_result.get("policy_document", {})
+        
         # Generate trust policy
         trust_policy = self._generate_trust_policy(trust_policy_type, cross_account_id)
         
@@ -151,42 +472,58 @@ class IAMRoleGenerator:
                 else:
                     description = f"IAM role for AWS CLI operations"
         
-        # Create base role structure
-        role_data = {
+        # Base role data doubles as the top level of the result, so the
+        # emitters read from the same dict that is returned
+        result = {
             "role_name": sanitized_name,
             "description": description,
             "assume_role_policy": trust_policy,
-            "policy_document": analysis_result.get("policy_document", {}),
+            "policy_document": policy_document,
             "trust_policy_type": trust_policy_type
         }
         
-        # Generate comprehensive result with all formats
-        result = {
-            # Base data
+        # JSON format (for compatibility)
+        result["json"] = {
             "role_name": sanitized_name,
             "description": description,
-            "assume_role_policy": trust_policy,
-            "policy_document": analysis_result.get("policy_document", {}),
-            "trust_policy_type": trust_policy_type,
-            
-            # JSON format (for compatibility)
-            "json": {
-                "role_name": sanitized_name,
-                "description": description,
-                "trust_policy": trust_policy,
-                "permissions_policy": analysis_result.get("policy_document", {}),
-                "policy_document": analysis_result.get("policy_document", {}),
-                "assume_role_policy": trust_policy
-            },
-            
-            # Generate all output formats
-            "terraform": self._generate_terraform_config(role_data),
-            "cloudformation": self._generate_cloudformation_config(role_data),
-            "aws_cli": self._generate_aws_cli_commands(role_data)
+            "trust_policy": trust_policy,
+            "permissions_policy": policy_document,
+            "policy_document": policy_document,
+            "assume_role_policy": trust_policy
         }
         
+        # Generate all output formats
+        result["terraform"] = self._generate_terraform_config(result)
+        result["cloudformation"] = self._generate_cloudformation_config(result)
+        result["aws_cli"] = self._generate_aws_cli_commands(result)
+        
         return result
     
+    def clear_cache(self) -> None:
+        """Drop all memoized role results."""
+        if self._cache is not None:
+            self._cache.clear()
+    
+    @staticmethod
+    def _make_cache_key(*parts: Any) -> bytes:
+        """Build a compact cache key from (possibly unhashable) role inputs."""
+        serialized = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.blake2b(serialized.encode("utf-8"), digest_size=16).digest()
+    
+    def _cache_get(self, key: bytes) -> Optional[Dict]:
+        """Return a cached result and mark it as most recently used."""
+        result = self._cache.get(key)
+        if result is not None:
+            self._cache.move_to_end(key)
+        return result
+    
+    def _cache_put(self, key: bytes, result: Dict) -> None:
+        """Store a result, evicting the least recently used entry if full."""
+        self._cache[key] = result
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+    
     def analyze_commands_for_role(self, commands: List[str]) -> AnalysisResult:
         """
         Analyze commands specifically for role generation.
@@ -205,74 +542,51 @@ class IAMRoleGenerator:
     
     def _create_role_config(self, role_name: str, trust_policy: Dict, **kwargs) -> RoleConfiguration:
         """Create role configuration."""
+        tags = kwargs.get('tags')
+        if tags is None:
+            tags = self._default_tags()
+        
         return RoleConfiguration(
             role_name=role_name,
             description=kwargs.get('description', f"IAM role for {role_name}"),
             assume_role_policy=trust_policy,
             max_session_duration=kwargs.get('max_session_duration', 3600),
             path=kwargs.get('path', '/'),
-            tags=kwargs.get('tags', {
-                'CreatedBy': 'IAMGenerator',
-                'CreatedAt': datetime.now().isoformat()
-            })
+            tags=tags
         )
     
     def _create_policy_config(self, policy_name: str, **kwargs) -> PolicyConfiguration:
         """Create policy configuration."""
+        tags = kwargs.get('policy_tags')
+        if tags is None:
+            tags = self._default_tags()
+        
         return PolicyConfiguration(
             policy_name=policy_name,
             description=kwargs.get('policy_description', f"Policy for {policy_name}"),
             path=kwargs.get('policy_path', '/'),
-            tags=kwargs.get('policy_tags', {
-                'CreatedBy': 'IAMGenerator',
-                'CreatedAt': datetime.now().isoformat()
-            })
+            tags=tags
         )
     
-    def _default_trust_policy(self) -> Dict:
-        """Get default trust policy for EC2 instances."""
+    @staticmethod
+    def _default_tags() -> Dict[str, str]:
+        """Build the default tags, stamped with the current time."""
         return {
-            "Version": "2012-10-17",
-            "Statement": [
-                {
-                    "Effect": "Allow",
-                    "Principal": {
-                        "Service": "ec2.amazonaws.com"
-                    },
-                    "Action": "sts:AssumeRole"
-                }
-            ]
+            'CreatedBy': 'IAMGenerator',
+            'CreatedAt': datetime.now().isoformat()
         }
     
+    def _default_trust_policy(self) -> Dict:
+        """Get default trust policy for EC2 instances."""
+        return _service_trust_policy("ec2.amazonaws.com")
+    
     def lambda_trust_policy(self) -> Dict:
         """Get trust policy for Lambda functions."""
-        return {
-            "Version": "2012-10-17",
-            "Statement": [
-                {
-                    "Effect": "Allow",
-                    "Principal": {
-                        "Service": "lambda.amazonaws.com"
-                    },
-                    "Action": "sts:AssumeRole"
-                }
-            ]
-        }
+        return _service_trust_policy("lambda.amazonaws.com")
     
     def ecs_trust_policy(self) -> Dict:
         """Get trust policy for ECS tasks."""
-        return {
-            "Version": "2012-10-17",
-            "Statement": [
-                {
-                    "Effect": "Allow",
-                    "Principal": {
-                        "Service": "ecs-tasks.amazonaws.com"
-                    },
-                    "Action": "sts:AssumeRole"
-                }
-            ]
-        }
+        return _service_trust_policy("ecs-tasks.amazonaws.com")
     
     def cross_account_trust_policy(self, account_ids: List[str], 
                                   external_id: Optional[str] = None,
@@ -291,11 +605,11 @@ class IAMRoleGenerator:
         principals = [f"arn:aws:iam::{account_id}:root" for account_id in account_ids]
         
         statement = {
-            "Effect": "Allow",
+            "Effect": _ALLOW,
             "Principal": {
                 "AWS": principals
             },
-            "Action": "sts:AssumeRole"
+            "Action": _ASSUME_ROLE
         }
         
         conditions = {}
@@ -309,7 +623,7 @@ class IAMRoleGenerator:
             statement["Condition"] = conditions
         
         return {
-            "Version": "2012-10-17",
+            "Version": _POLICY_VERSION,
             "Statement": [statement]
         }
     
@@ -317,81 +631,45 @@ class IAMRoleGenerator:
                           policy_config: PolicyConfiguration,
                           policy_document: Dict) -> str:
         """Generate Terraform configuration."""
-        terraform_config = f'''# IAM Role and Policy Configuration
-# Generated by IAM Generator
-
-resource "aws_iam_role" "{role_config.role_name}" {{
-  name               = "{role_config.role_name}"
-  description        = "{role_config.description}"
-  path               = "{role_config.path}"
-  max_session_duration = {role_config.max_session_duration}
-  
-  assume_role_policy = jsonencode({json.dumps(role_config.assume_role_policy, indent=2)})
-  
-  tags = {{
-{self._format_terraform_tags(role_config.tags)}
-  }}
-}}
-
-resource "aws_iam_policy" "{policy_config.policy_name}" {{
-  name        = "{policy_config.policy_name}"
-  description = "{policy_config.description}"
-  path        = "{policy_config.path}"
-  
-  policy = jsonencode({json.dumps(policy_document, indent=2)})
-  
-  tags = {{
-{self._format_terraform_tags(policy_config.tags)}
-  }}
-}}
-
-resource "aws_iam_role_policy_attachment" "{role_config.role_name}_policy_attachment" {{
-  role       = aws_iam_role.{role_config.role_name}.name
-  policy_arn = aws_iam_policy.{policy_config.policy_name}.arn
-}}
-
-# Instance Profile (if needed for EC2)
-resource "aws_iam_instance_profile" "{role_config.role_name}_profile" {{
-  name = "{role_config.role_name}-profile"
-  role = aws_iam_role.{role_config.role_name}.name
-}}
-
-# Outputs
-output "{role_config.role_name}_arn" {{
-  description = "ARN of the IAM role"
-  value       = aws_iam_role.{role_config.role_name}.arn
-}}
-
-output "{policy_config.policy_name}_arn" {{
-  description = "ARN of the IAM policy"
-  value       = aws_iam_policy.{policy_config.policy_name}.arn
-}}
-'''
-        return terraform_config
+        return _TERRAFORM_TEMPLATE.substitute(
+            role_name=role_config.role_name,
+            role_description=role_config.description,
+            role_path=role_config.path,
+            max_session_duration=role_config.max_session_duration,
+            trust_policy=json.dumps(role_config.assume_role_policy, indent=2),
+            role_tags=self._format_terraform_tags(role_config.tags),
+            policy_name=policy_config.policy_name,
+            policy_description=policy_config.description,
+            policy_path=policy_config.path,
+            policy_document=json.dumps(policy_document, indent=2),
+            policy_tags=self._format_terraform_tags(policy_config.tags)
+        )
     
     def _format_terraform_tags(self, tags: Dict[str, str]) -> str:
         """Format tags for Terraform configuration."""
         if not tags:
             return ""
         
-        tag_lines = []
-        for key, value in tags.items():
-            tag_lines.append(f'    {key} = "{value}"')
-        
-        return '\n'.join(tag_lines)
+        return '\n'.join(f'    {key} = "{value}"' for key, value in tags.items())
     
     def _generate_cloudformation(self, role_config: RoleConfiguration,
                                policy_config: PolicyConfiguration,
                                policy_document: Dict) -> Dict:
         """Generate CloudFormation template."""
+        role_name = role_config.role_name
+        policy_name = policy_config.policy_name
+        role_key = role_name + "Role"
+        policy_key = policy_name + "Policy"
+        profile_key = role_name + "InstanceProfile"
+        
         return {
             "AWSTemplateFormatVersion": "2010-09-09",
-            "Description": f"IAM Role and Policy for {role_config.role_name}",
+            "Description": f"IAM Role and Policy for {role_name}",
             "Resources": {
-                f"{role_config.role_name}Role": {
+                role_key: {
                     "Type": "AWS::IAM::Role",
                     "Properties": {
-                        "RoleName": role_config.role_name,
+                        "RoleName": role_name,
                         "Description": role_config.description,
                         "Path": role_config.path,
                         "MaxSessionDuration": role_config.max_session_duration,
@@ -401,153 +679,68 @@ output "{policy_config.policy_name}_arn" {{
                         ]
                     }
                 },
-                f"{policy_config.policy_name}Policy": {
+                policy_key: {
                     "Type": "AWS::IAM::Policy",
                     "Properties": {
-                        "PolicyName": policy_config.policy_name,
+                        "PolicyName": policy_name,
                         "PolicyDocument": policy_document,
-                        "Roles": [{"Ref": f"{role_config.role_name}Role"}]
+                        "Roles": [{"Ref": role_key}]
                     }
                 },
-                f"{role_config.role_name}InstanceProfile": {
+                profile_key: {
                     "Type": "AWS::IAM::InstanceProfile",
                     "Properties": {
-                        "InstanceProfileName": f"{role_config.role_name}-profile",
-                        "Roles": [{"Ref": f"{role_config.role_name}Role"}]
+                        "InstanceProfileName": role_name + "-profile",
+                        "Roles": [{"Ref": role_key}]
                     }
                 }
             },
             "Outputs": {
-                f"{role_config.role_name}Arn": {
+                role_name + "Arn": {
                     "Description": "ARN of the IAM role",
-                    "Value": {"Fn::GetAtt": [f"{role_config.role_name}Role", "Arn"]},
-                    "Export": {"Name": {"Fn::Sub": f"${{AWS::StackName}}-{role_config.role_name}-Arn"}}
+                    "Value": {"Fn::GetAtt": [role_key, "Arn"]},
+                    "Export": {"Name": {"Fn::Sub": f"${{AWS::StackName}}-{role_name}-Arn"}}
                 },
-                f"{policy_config.policy_name}Arn": {
+                policy_name + "Arn": {
                     "Description": "ARN of the IAM policy",
-                    "Value": {"Ref": f"{policy_config.policy_name}Policy"},
-                    "Export": {"Name": {"Fn::Sub": f"${{AWS::StackName}}-{policy_config.policy_name}-Arn"}}
+                    "Value": {"Ref": policy_key},
+                    "Export": {"Name": {"Fn::Sub": f"${{AWS::StackName}}-{policy_name}-Arn"}}
                 }
             }
         }
     
     def _generate_cli_commands(self, role_config: RoleConfiguration,
                              policy_config: PolicyConfiguration,
-                             policy_document: Dict) -> List[str]:
+                             policy_document: Dict) -> str:
         """Generate AWS CLI commands to create the role and policy."""
-        commands = []
-        
-        # Create trust policy file
-        commands.append("# Save trust policy to file")
-        commands.append(f"cat > trust-policy.json << 'EOF'")
-        commands.append(json.dumps(role_config.assume_role_policy, indent=2))
-        commands.append("EOF")
-        commands.append("")
-        
-        # Create permissions policy file
-        commands.append("# Save permissions policy to file")
-        commands.append(f"cat > {policy_config.policy_name.lower()}-policy.json << 'EOF'")
-        commands.append(json.dumps(policy_document, indent=2))
-        commands.append("EOF")
-        commands.append("")
-        
-        # Create IAM role
-        create_role_cmd = f"aws iam create-role --role-name {role_config.role_name}"
-        create_role_cmd += f" --assume-role-policy-document file://trust-policy.json"
-        create_role_cmd += f" --description '{role_config.description}'"
-        create_role_cmd += f" --path {role_config.path}"
-        create_role_cmd += f" --max-session-duration {role_config.max_session_duration}"
-        commands.append(create_role_cmd)
-        
-        # Create IAM policy
-        create_policy_cmd = f"aws iam create-policy --policy-name {policy_config.policy_name}"
-        create_policy_cmd += f" --policy-document file://{policy_config.policy_name.lower()}-policy.json"
-        create_policy_cmd += f" --description '{policy_config.description}'"
-        create_policy_cmd += f" --path {policy_config.path}"
-        commands.append(create_policy_cmd)
-        
-        # Attach policy to role
-        attach_cmd = f"aws iam attach-role-policy --role-name {role_config.role_name}"
-        attach_cmd += f" --policy-arn arn:aws:iam::$(aws sts get-caller-identity --query Account --output text):policy{policy_config.path}{policy_config.policy_name}"
-        commands.append(attach_cmd)
-        
-        # Create instance profile (for EC2)
-        commands.append("")
-        commands.append("# Create instance profile for EC2 (optional)")
-        commands.append(f"aws iam create-instance-profile --instance-profile-name {role_config.role_name}-profile")
-        commands.append(f"aws iam add-role-to-instance-profile --instance-profile-name {role_config.role_name}-profile --role-name {role_config.role_name}")
+        script = _CLI_TEMPLATE.format(
+            role_name=role_config.role_name,
+            role_description=role_config.description,
+            role_path=role_config.path,
+            max_session_duration=role_config.max_session_duration,
+            trust_policy=json.dumps(role_config.assume_role_policy, indent=2),
+            policy_name=policy_config.policy_name,
+            policy_file=policy_config.policy_name.lower(),
+            policy_description=policy_config.description,
+            policy_path=policy_config.path,
+            policy_document=json.dumps(policy_document, indent=2)
+        )
         
         # Add tags
         if role_config.tags:
-            commands.append("")
-            commands.append("# Add tags to role")
-            tag_specs = []
-            for key, value in role_config.tags.items():
-                tag_specs.append(f"Key={key},Value={value}")
-            tag_cmd = f"aws iam tag-role --role-name {role_config.role_name} --tags {' '.join(tag_specs)}"
-            commands.append(tag_cmd)
+            tag_specs = " ".join(f"Key={key},Value={value}" for key, value in role_config.tags.items())
+            script += (
+                "\n\n# Add tags to role\n"
+                f"aws iam tag-role --role-name {role_config.role_name} --tags {tag_specs}"
+            )
         
-        return commands
+        return script
 
 
     def _generate_trust_policy(self, trust_policy_type: str, cross_account_id: Optional[str] = None) -> Dict:
         """Generate trust policy based on type."""
-        if trust_policy_type == "ec2":
-            return {
-                "Version": "2012-10-17",
-                "Statement": [
-                    {
-                        "Effect": "Allow",
-                        "Principal": {"Service": "ec2.amazonaws.com"},
-                        "Action": "sts:AssumeRole"
-                    }
-                ]
-            }
-        elif trust_policy_type == "lambda":
-            return {
-                "Version": "2012-10-17",
-                "Statement": [
-                    {
-                        "Effect": "Allow",
-                        "Principal": {"Service": "lambda.amazonaws.com"},
-                        "Action": "sts:AssumeRole"
-                    }
-                ]
-            }
-        elif trust_policy_type == "ecs":
-            return {
-                "Version": "2012-10-17",
-                "Statement": [
-                    {
-                        "Effect": "Allow",
-                        "Principal": {"Service": "ecs-tasks.amazonaws.com"},
-                        "Action": "sts:AssumeRole"
-                    }
-                ]
-            }
-        elif trust_policy_type == "cross-account":
-            return {
-                "Version": "2012-10-17",
-                "Statement": [
-                    {
-                        "Effect": "Allow",
-                        "Principal": {"AWS": f"arn:aws:iam::{cross_account_id}:root"},
-                        "Action": "sts:AssumeRole"
-                    }
-                ]
-            }
-        else:
-            # Default trust policy
-            return {
-                "Version": "2012-10-17",
-                "Statement": [
-                    {
-                        "Effect": "Allow",
-                        "Principal": {"Service": "lambda.amazonaws.com"},
-                        "Action": "sts:AssumeRole"
-                    }
-                ]
-            }
+        builder = _TRUST_POLICY_BUILDERS.get(trust_policy_type, _TRUST_POLICY_BUILDERS["default"])
+        return builder(cross_account_id)
     
     def _sanitize_role_name(self, role_name: str) -> str:
         """Sanitize role name to meet AWS requirements."""
@@ -562,114 +755,81 @@ output "{policy_config.policy_name}_arn" {{
     
     def _generate_terraform_config(self, role_data: Dict) -> str:
         """Generate Terraform configuration as a string."""
-        terraform_hcl = f'''# IAM Role and Policy Configuration
-# Generated by IAM Generator
-
-resource "aws_iam_role" "{self._terraform_name(role_data['role_name'])}" {{
-  name        = "{role_data['role_name']}"
-  description = "{role_data['description']}"
-  
-  assume_role_policy = jsonencode({json.dumps(role_data['assume_role_policy'], indent=2)})
-  
-  tags = {{
-    Name      = "{role_data['role_name']}"
-    Generator = "IAMGenerator"
-  }}
-}}
-
-resource "aws_iam_policy" "{self._terraform_name(role_data['role_name'])}_policy" {{
-  name        = "{role_data['role_name']}_policy"
-  description = "Policy for {role_data['role_name']}"
-  
-  policy = jsonencode({json.dumps(role_data['policy_document'], indent=2)})
-  
-  tags = {{
-    Name      = "{role_data['role_name']}_policy"
-    Generator = "IAMGenerator"
-  }}
-}}
-
-resource "aws_iam_role_policy_attachment" "{self._terraform_name(role_data['role_name'])}_attachment" {{
-  role       = aws_iam_role.{self._terraform_name(role_data['role_name'])}.name
-  policy_arn = aws_iam_policy.{self._terraform_name(role_data['role_name'])}_policy.arn
-}}
-
-# Outputs
-output "{self._terraform_name(role_data['role_name'])}_arn" {{
-  description = "ARN of the IAM role"
-  value       = aws_iam_role.{self._terraform_name(role_data['role_name'])}.arn
-}}
-
-output "{self._terraform_name(role_data['role_name'])}_policy_arn" {{
-  description = "ARN of the IAM policy"
-  value       = aws_iam_policy.{self._terraform_name(role_data['role_name'])}_policy.arn
-}}
-'''
-        return terraform_hcl
+        role_name = role_data['role_name']
+        return _TERRAFORM_CONFIG_TEMPLATE.substitute(
+            tf_name=self._terraform_name(role_name),
+            role_name=role_name,
+            description=role_data['description'],
+            trust_policy=json.dumps(role_data['assume_role_policy'], indent=2),
+            policy_document=json.dumps(role_data['policy_document'], indent=2)
+        )
 
     def _generate_cloudformation_config(self, role_data: Dict) -> Dict:
         """Generate CloudFormation template as a dictionary."""
+        role_name = role_data['role_name']
+        role_key = role_name + "Role"
+        policy_key = role_name + "Policy"
+        
         return {
             "AWSTemplateFormatVersion": "2010-09-09",
-            "Description": f"IAM Role and Policy for {role_data['role_name']}",
+            "Description": f"IAM Role and Policy for {role_name}",
             "Resources": {
-                f"{role_data['role_name']}Role": {
+                role_key: {
                     "Type": "AWS::IAM::Role",
                     "Properties": {
-                        "RoleName": role_data['role_name'],
+                        "RoleName": role_name,
                         "Description": role_data['description'],
                         "AssumeRolePolicyDocument": role_data['assume_role_policy']
                     }
                 },
-                f"{role_data['role_name']}Policy": {
+                policy_key: {
                     "Type": "AWS::IAM::Policy",
                     "Properties": {
-                        "PolicyName": f"{role_data['role_name']}_policy",
+                        "PolicyName": role_name + "_policy",
                         "PolicyDocument": role_data['policy_document'],
-                        "Roles": [{"Ref": f"{role_data['role_name']}Role"}]
+                        "Roles": [{"Ref": role_key}]
                     }
                 }
             },
             "Outputs": {
                 "RoleArn": {
                     "Description": "ARN of the created IAM role",
-                    "Value": {"Fn::GetAtt": [f"{role_data['role_name']}Role", "Arn"]}
+                    "Value": {"Fn::GetAtt": [role_key, "Arn"]}
                 },
                 "PolicyArn": {
                     "Description": "ARN of the created IAM policy",
-                    "Value": {"Ref": f"{role_data['role_name']}Policy"}
+                    "Value": {"Ref": policy_key}
                 }
             }
         }
 
-    def _generate_aws_cli_commands(self, role_data: Dict) -> List[str]:
-        """Generate AWS CLI commands as a list of strings."""
-        commands = [
-            f"# Create IAM role {role_data['role_name']}",
-            "",
-            "# Create trust policy file",
-            "cat > trust-policy.json << 'EOF'",
-            json.dumps(role_data['assume_role_policy'], indent=2),
-            "EOF",
-            "",
-            "# Create permissions policy file",
-            "cat > permissions-policy.json << 'EOF'",
-            json.dumps(role_data['policy_document'], indent=2),
-            "EOF",
-            "",
-            f"# Create the IAM role",
-            f"aws iam create-role --role-name {role_data['role_name']} --assume-role-policy-document file://trust-policy.json --description '{role_data['description']}'",
-            "",
-            f"# Create the IAM policy",
-            f"aws iam create-policy --policy-name {role_data['role_name']}_policy --policy-document file://permissions-policy.json --description 'Policy for {role_data['role_name']}'",
-            "",
-            f"# Attach policy to role",
-            f"aws iam attach-role-policy --role-name {role_data['role_name']} --policy-arn arn:aws:iam::ACCOUNT_ID:policy/{role_data['role_name']}_policy",
-            "",
-            "# Clean up temporary files",
-            "rm trust-policy.json permissions-policy.json"
-        ]
-        return commands
+    def _generate_cloudformation_text(self, role_data: Dict) -> str:
+        """Generate the CloudFormation template as JSON text.
+        
+        Equivalent to json.dumps(self._generate_cloudformation_config(role_data), indent=2),
+        but renders the pre-serialized policies straight into a text template.
+        Use this when the template is written to a file or terminal.
+        """
+        role_name = role_data['role_name']
+        return _CFN_TEMPLATE.substitute(
+            description=json.dumps(f"IAM Role and Policy for {role_name}"),
+            role_key=json.dumps(role_name + "Role"),
+            policy_key=json.dumps(role_name + "Policy"),
+            role_name=json.dumps(role_name),
+            role_description=json.dumps(role_data['description']),
+            policy_name=json.dumps(role_name + "_policy"),
+            trust_policy=_nested_json(role_data['assume_role_policy'], 4),
+            policy_document=_nested_json(role_data['policy_document'], 4)
+        )
+
+    def _generate_aws_cli_commands(self, role_data: Dict) -> str:
+        """Generate AWS CLI commands as a single shell script."""
+        return _AWS_CLI_TEMPLATE.format(
+            role_name=role_data['role_name'],
+            description=role_data['description'],
+            trust_policy=json.dumps(role_data['assume_role_policy'], indent=2),
+            policy_document=json.dumps(role_data['policy_document'], indent=2)
+        )
 
     def _terraform_name(self, name: str) -> str:
         """Convert role name to Terraform-safe identifier."""
@@ -730,11 +890,10 @@ if __name__ == "__main__":
     )
     
     print("Generated Role Configuration:")
-    print(f"Role Name: {role.role_config.role_name}")
-    print(f"Policy Name: {role.policy_config.policy_name}")
+    print(f"Role Name: {role['role_name']}")
+    print(f"Trust Policy Type: {role['trust_policy_type']}")
     print("\nTerraform Configuration:")
-    print(role.terraform_config)
+    print(role["terraform"])
     
     print("\nAWS CLI Commands:")
-    for cmd in role.aws_cli_commands:
-        print(cmd)
+    print(role["aws_cli"])
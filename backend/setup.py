@@ -8,6 +8,7 @@ setup(
     author_email="team@iamgenerator.dev",
     license="Proprietary",
     packages=find_packages(),
+    zip_safe=False,
     python_requires=">=3.8",
     install_requires=[
         "boto3>=1.34.0",
@@ -45,9 +45,11 @@ run_backend() {
     # Check if reload is enabled via environment variable
     if [ "${RELOAD}" = "true" ]; then
         echo "🔄 Development mode: Auto-reload enabled"
+        # A single server process, so the analyzer pool may use every CPU
+        export WORKERS=1
         exec uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000} --reload --log-level debug
     else
-        exec uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000} --log-level info
+        exec uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000} --workers ${WORKERS:-${WEB_CONCURRENCY:-$(nproc)}} --log-level info
     fi
 }
 
@@ -61,7 +61,7 @@ fi
 
 # Start backend in background
 echo "🚀 Starting backend server on http://localhost:8000"
-PYTHONPATH=backend python -m backend.app.main &
+RELOAD=true PYTHONPATH=backend python -m backend.app.main &
 BACKEND_PID=$!
 
 # Wait for backend to start
@@ -229,3 +229,149 @@ class TestIAMPermissionAnalyzer:
             arns = result["resource_arns"]
             assert any("bucket1" in arn for arn in arns)
             assert any("bucket2" in arn for arn in arns)
+    
+    def test_debug_override_per_call(self):
+        """Test that debug warnings can be enabled per call on a shared analyzer."""
+        command = "aws s3 frobnicate-widgets s3://bucket"
+        
+        assert self.analyzer.analyze_command(command)["warnings"] == []
+        
+        debug_result = self.analyzer.analyze_command(command, debug=True)
+        assert any("fallback" in warning for warning in debug_result["warnings"])
+        
+        # The override must not stick to the instance
+        assert self.analyzer.debug_mode is False
+        assert self.analyzer.analyze_command(command)["warnings"] == []
+    
+    def test_permissions_by_command(self):
+        """Test that analyze_commands maps each command to its own permissions."""
+        commands = [
+            "aws s3 ls s3://bucket",
+            "aws ec2 describe-instances",
+            "invalid",
+        ]
+        result = self.analyzer.analyze_commands(commands, include_read_only=False)
+        
+        by_command = result.permissions_by_command
+        assert set(by_command) == set(commands[:2])
+        assert all(perm.action.startswith("s3:") for perm in by_command[commands[0]])
+        assert all(perm.action.startswith("ec2:") for perm in by_command[commands[1]])
+    
+    def test_build_policy(self):
+        """Test that duplicates collapse, specific resources replace wildcards, and statements group by resource."""
+        from iam_generator.permissions_db import IAMPermission
+        
+        permissions = [
+            IAMPermission(action="s3:GetObject", resource="*"),
+            IAMPermission(action="s3:GetObject", resource="arn:aws:s3:::b/*"),
+            IAMPermission(action="s3:GetObject", resource="arn:aws:s3:::a/*"),
+            IAMPermission(action="s3:GetObject", resource="arn:aws:s3:::b/*"),
+            IAMPermission(action="s3:ListBucket", resource="*"),
+            IAMPermission(action="s3:ListBucket", resource="*"),
+        ]
+        result, policy = self.analyzer._build_policy(permissions)
+        
+        assert [(perm.action, perm.resource) for perm in result] == [
+            ("s3:GetObject", "arn:aws:s3:::a/*"),
+            ("s3:GetObject", "arn:aws:s3:::b/*"),
+            ("s3:ListBucket", "*"),
+        ]
+        assert policy["Statement"] == [
+            {"Effect": "Allow", "Action": ["s3:GetObject"], "Resource": "arn:aws:s3:::a/*"},
+            {"Effect": "Allow", "Action": ["s3:GetObject"], "Resource": "arn:aws:s3:::b/*"},
+            {"Effect": "Allow", "Action": ["s3:ListBucket"], "Resource": "*"},
+        ]
+    
+    def test_analysis_result_to_json(self):
+        """Test that AnalysisResult serializes to JSON bytes matching model_dump."""
+        import json
+        
+        result = self.analyzer.analyze_commands(["aws s3 ls s3://bucket"])
+        payload = result.to_json()
+        
+        assert isinstance(payload, bytes)
+        assert json.loads(payload) == result.model_dump(mode="json")
+    
+    def test_repeated_commands_share_database_lookup(self):
+        """Test that a batch looks up each (service, action) pair only once."""
+        db = self.analyzer.permissions_db
+        with patch.object(db, "get_permissions_object", wraps=db.get_permissions_object) as lookup:
+            self.analyzer.generate_resource_specific_policy(
+                ["aws s3 ls s3://a", "aws s3 ls s3://b", "aws ec2 describe-instances"]
+            )
+        
+        assert lookup.call_count == 2
+    
+    def test_generate_arns_from_command_params(self):
+        """Test per-service ARN generation from command parameters."""
+        from iam_generator.parser import ParsedCommand
+        
+        def arns(service, action, parameters):
+            parsed = ParsedCommand(service=service, action="x", parameters=parameters,
+                                   resource_arns=[], raw_command="aws")
+            return self.analyzer._generate_arns_from_command_params(parsed, action, "123456789012", None)
+        
+        s3_params = {"arg_0": "s3://src/a.txt", "arg_1": "s3://dst/", "arg_2": "local.txt"}
+        assert arns("s3", "s3:ListBucket", s3_params) == ["arn:aws:s3:::src", "arn:aws:s3:::dst"]
+        assert arns("s3", "s3:GetObject", s3_params) == ["arn:aws:s3:::src/a.txt", "arn:aws:s3:::dst/*"]
+        assert arns("s3", "s3:GetBucketPolicy", s3_params) == []
+        
+        ec2_params = {"instance-ids": ["i-1", "i-2"], "volume-id": "vol-1"}
+        assert arns("ec2", "ec2:StopInstances", ec2_params) == [
+            "arn:aws:ec2:*:123456789012:instance/i-1",
+            "arn:aws:ec2:*:123456789012:instance/i-2",
+        ]
+        assert arns("ec2", "ec2:AttachVolume", ec2_params) == ["arn:aws:ec2:*:123456789012:volume/vol-1"]
+        assert arns("ec2", "ec2:DescribeImages", ec2_params) == []
+        
+        assert arns("iam", "iam:GetRole", {"role-name": "R", "user-name": "U"}) == [
+            "arn:aws:iam::123456789012:role/R"
+        ]
+        assert arns("sqs", "sqs:SendMessage", {"queue-url": "q"}) == []
+    
+    def test_batch_collections_keep_first_seen_order(self):
+        """Test that services and resource ARNs are de-duplicated in first-seen order."""
+        result = self.analyzer.analyze_commands([
+            "aws s3 ls s3://b",
+            "aws ec2 describe-instances",
+            "aws s3 ls s3://a",
+            "aws s3 ls s3://b",
+        ])
+        
+        assert result.services_used == ["s3", "ec2"]
+        assert result.resource_arns == ["arn:aws:s3:::b", "arn:aws:s3:::a"]
+    
+    def test_build_policy_groups_equal_conditions(self):
+        """Test that equal conditions share a statement regardless of key order."""
+        from iam_generator.permissions_db import IAMPermission
+        
+        condition = {"Bool": {"aws:SecureTransport": "true"}, "StringEquals": {"aws:RequestedRegion": "us-east-1"}}
+        reordered = dict(reversed(list(condition.items())))
+        permissions = [
+            IAMPermission(action="s3:PutObject", resource="*", condition=condition),
+            IAMPermission(action="s3:GetObject", resource="*", condition=reordered),
+            IAMPermission(action="s3:GetObject", resource="*", condition=condition),
+            IAMPermission(action="s3:ListBucket", resource="*"),
+        ]
+        result, policy = self.analyzer._build_policy(permissions)
+        
+        assert len(result) == 3
+        assert [statement["Action"] for statement in policy["Statement"]] == [
+            ["s3:GetObject", "s3:PutObject"],
+            ["s3:ListBucket"],
+        ]
+        assert policy["Statement"][0]["Condition"] == condition
+    
+    def test_get_service_summary(self):
+        """Test that the service summary groups actions, permissions and resources per service."""
+        summary = self.analyzer.get_service_summary([
+            "aws s3 ls s3://bucket",
+            "aws s3 ls s3://bucket",
+            "aws ec2 describe-instances",
+        ])
+        
+        assert set(summary) == {"s3", "ec2"}
+        assert summary["s3"]["actions"] == ["ls"]
+        assert summary["s3"]["resources"] == ["arn:aws:s3:::bucket"]
+        assert "s3:ListBucket" in summary["s3"]["permissions"]
+        assert all(action.startswith("ec2:") for action in summary["ec2"]["permissions"])
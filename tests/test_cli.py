@@ -78,6 +78,69 @@ class TestCLI:
         # Should contain JSON output
         assert "{" in result.output
     
+    @patch('iam_generator.cli.IAMPermissionAnalyzer')
+    def test_analyze_saves_displayed_yaml(self, mock_analyzer):
+        """Test that --save writes the same YAML text that was displayed."""
+        mock_instance = MagicMock()
+        mock_analyzer.return_value = mock_instance
+        mock_instance.analyze_command.return_value = {
+            "service": "s3",
+            "action": "ls",
+            "required_permissions": [{"action": "s3:ListBucket", "resource": "arn:aws:s3:::bucket"}]
+        }
+        
+        with self.runner.isolated_filesystem():
+            result = self.runner.invoke(cli, [
+                "analyze", "--save", "output.yaml", "--output", "yaml", "s3", "ls", "s3://bucket"
+            ])
+            
+            assert result.exit_code == 0
+            with open("output.yaml") as f:
+                saved = f.read()
+        
+        assert result.output.startswith(saved)
+        assert "s3:ListBucket" in saved
+    
+    @patch('iam_generator.cli.IAMPermissionAnalyzer')
+    def test_analyze_json_output_is_plain_when_piped(self, mock_analyzer):
+        """Test that piped JSON output is written unhighlighted and parses back."""
+        mock_instance = MagicMock()
+        mock_analyzer.return_value = mock_instance
+        analysis = {
+            "service": "s3",
+            "action": "ls",
+            "required_permissions": [
+                {"action": "s3:ListBucket", "resource": "arn:aws:s3:::" + "b" * 200}
+            ]
+        }
+        mock_instance.analyze_command.return_value = analysis
+        
+        result = self.runner.invoke(cli, ["analyze", "--output", "json", "s3", "ls", "s3://bucket"])
+        
+        assert result.exit_code == 0
+        assert json.loads(result.output) == analysis
+    
+    @patch('iam_generator.cli.IAMPermissionAnalyzer')
+    def test_analyze_table_output_large_permission_list(self, mock_analyzer):
+        """Test that a large permission list is printed as plain aligned columns."""
+        mock_instance = MagicMock()
+        mock_analyzer.return_value = mock_instance
+        mock_instance.analyze_command.return_value = {
+            "service": "s3",
+            "action": "cp",
+            "original_command": "aws s3 cp s3://bucket/key .",
+            "required_permissions": [
+                {"action": "s3:GetObject", "resource": f"arn:aws:s3:::bucket/key{i}"}
+                for i in range(250)
+            ]
+        }
+        
+        result = self.runner.invoke(cli, ["analyze", "s3", "cp", "s3://bucket/key", "."])
+        
+        assert result.exit_code == 0
+        assert "Permission    Resource" in result.output
+        assert "s3:GetObject  arn:aws:s3:::bucket/key249" in result.output
+    
     @patch('iam_generator.cli.IAMPermissionAnalyzer')
     def test_analyze_with_save_option(self, mock_analyzer):
         """Test analyzing command with save option."""
@@ -179,6 +242,7 @@ class TestCLI:
         
         assert result.exit_code == 1
         assert "account-id is required" in result.output
+        mock_analyzer_instance.analyze_command.assert_not_called()
     
     @patch('iam_generator.cli.IAMPermissionAnalyzer')
     @patch('iam_generator.cli.IAMRoleGenerator')
@@ -245,6 +309,107 @@ class TestCLI:
             assert "Analyzing 3 commands" in result.output
             assert "Batch analysis complete" in result.output
     
+    @patch('iam_generator.cli.IAMPermissionAnalyzer')
+    def test_batch_analyze_ndjson(self, mock_analyzer):
+        """Test that NDJSON batch output writes one record per command."""
+        mock_instance = MagicMock()
+        mock_analyzer.return_value = mock_instance
+        mock_instance.analyze_command.side_effect = [
+            {"service": "s3", "action": "ls", "required_permissions": []},
+            ValueError("bad command"),
+        ]
+        
+        with self.runner.isolated_filesystem():
+            with open("commands.txt", "w") as f:
+                f.write("s3 ls s3://bucket1\n")
+                f.write("ec2 describe-instances\n")
+            
+            result = self.runner.invoke(cli, [
+                "batch-analyze", "commands.txt", "--format", "ndjson", "--output-dir", "out"
+            ])
+            
+            assert result.exit_code == 0
+            with open("out/batch_analysis.ndjson") as f:
+                records = [json.loads(line) for line in f]
+        
+        assert records == [
+            {"command": "aws s3 ls s3://bucket1",
+             "result": {"service": "s3", "action": "ls", "required_permissions": []}},
+            {"command": "aws ec2 describe-instances", "result": {"error": "bad command"}},
+        ]
+    
+    @patch('iam_generator.cli.IAMPermissionAnalyzer')
+    def test_batch_analyze_reuses_repeated_commands(self, mock_analyzer):
+        """Test that a command repeated in the batch file is analyzed only once."""
+        mock_instance = MagicMock()
+        mock_analyzer.return_value = mock_instance
+        mock_instance.analyze_command.side_effect = [
+            {"service": "s3", "action": "ls", "required_permissions": []},
+            {"service": "ec2", "action": "describe-instances", "required_permissions": []},
+        ]
+        
+        with self.runner.isolated_filesystem():
+            with open("commands.txt", "w") as f:
+                f.write("s3 ls s3://bucket1\n")
+                f.write("ec2 describe-instances\n")
+                f.write("aws s3 ls s3://bucket1\n")
+            
+            result = self.runner.invoke(cli, [
+                "batch-analyze", "commands.txt", "--format", "ndjson", "--output-dir", "out"
+            ])
+            
+            assert result.exit_code == 0
+            with open("out/batch_analysis.ndjson") as f:
+                records = [json.loads(line) for line in f]
+        
+        assert mock_instance.analyze_command.call_count == 2
+        assert [record["command"] for record in records] == [
+            "aws s3 ls s3://bucket1", "aws ec2 describe-instances", "aws s3 ls s3://bucket1"
+        ]
+        assert records[2] == records[0]
+    
+    def test_batch_analyze_jobs_matches_sequential(self):
+        """Test that a parallel batch writes the same results, in order, as a sequential one."""
+        with self.runner.isolated_filesystem():
+            with open("commands.txt", "w") as f:
+                f.write("s3 ls s3://bucket1\n")
+                f.write("not-a-service do-something\n")
+                f.write("ec2 describe-instances\n")
+            
+            outputs = []
+            for jobs in ("1", "2"):
+                result = self.runner.invoke(cli, [
+                    "batch-analyze", "commands.txt", "--output-dir", f"out{jobs}", "--jobs", jobs
+                ])
+                assert result.exit_code == 0
+                with open(f"out{jobs}/batch_analysis.json") as f:
+                    outputs.append(json.load(f))
+        
+        assert outputs[0] == outputs[1]
+        assert list(outputs[1]) == [
+            "aws s3 ls s3://bucket1",
+            "aws not-a-service do-something",
+            "aws ec2 describe-instances",
+        ]
+    
+    @patch('iam_generator.cli.IAMPermissionAnalyzer')
+    def test_batch_analyze_jobs_skips_parent_analyzer(self, mock_analyzer):
+        """Test that a parallel batch leaves analysis to the spawned workers."""
+        with self.runner.isolated_filesystem():
+            with open("commands.txt", "w") as f:
+                f.write("s3 ls s3://bucket1\n")
+            
+            result = self.runner.invoke(cli, [
+                "batch-analyze", "commands.txt", "--output-dir", "out", "--jobs", "2"
+            ])
+            
+            assert result.exit_code == 0
+            with open("out/batch_analysis.json") as f:
+                results = json.load(f)
+        
+        mock_analyzer.assert_not_called()
+        assert results["aws s3 ls s3://bucket1"]["service"] == "s3"
+    
     @patch('iam_generator.cli.IAMPermissionAnalyzer')
     def test_list_services_command(self, mock_analyzer):
         """Test list-services command."""
@@ -258,6 +423,19 @@ class TestCLI:
         assert result.exit_code == 0
         assert "Supported AWS Services" in result.output
     
+    @patch('iam_generator.cli.AWSCLIDocumentationScraper')
+    def test_list_services_plain_when_piped(self, mock_scraper):
+        """Test that list-services writes tab-separated rows when stdout is not a terminal."""
+        mock_scraper.return_value.discover_services.return_value = ["s3", "not-a-service"]
+        
+        result = self.runner.invoke(cli, ["list-services"])
+        
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert lines[0] == "not-a-service\t⚠ Missing\t0"
+        assert lines[1].startswith("s3\t✓ Supported\t")
+        assert len(lines) == 2
+    
     @patch('iam_generator.cli.IAMPermissionAnalyzer')
     def test_analyze_with_verbose_flag(self, mock_analyzer):
         """Test analyze command with verbose flag."""
@@ -137,3 +137,22 @@ class TestAWSCLIParser:
         
         arns = self.parser.extract_arns(result)
         assert any("my-function" in arn for arn in arns)
+    
+    def test_normalize_commands(self):
+        """Test batch normalization of raw command lines."""
+        raw = [
+            "  aws s3 ls  \n",
+            "\n",
+            "# comment\n",
+            "   # indented comment\n",
+            "ec2 describe-instances\n",
+            "aws2 iam list-roles",
+            "aws\t sts get-caller-identity",
+        ]
+        
+        assert AWSCLIParser.normalize_commands(raw) == [
+            "aws s3 ls",
+            "aws ec2 describe-instances",
+            "aws iam list-roles",
+            "aws sts get-caller-identity",
+        ]
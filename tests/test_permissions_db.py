@@ -3,7 +3,7 @@ Tests for the IAM permissions database module.
 """
 
 import pytest
-from iam_generator.permissions_db import IAMPermissionsDatabase
+from iam_generator.permissions_db import IAMPermissionsDatabase, CommandPermissions, IAMPermission
 
 
 class TestIAMPermissionsDatabase:
@@ -66,6 +66,13 @@ class TestIAMPermissionsDatabase:
         assert "logs" in services
         assert "sts" in services
     
+    def test_is_supported_service(self):
+        """Test service membership matches the supported services list."""
+        for service in self.permissions_db.get_supported_services():
+            assert self.permissions_db.is_supported_service(service)
+        
+        assert not self.permissions_db.is_supported_service("nonexistent-service")
+    
     def test_get_service_actions(self):
         """Test getting actions for a specific service."""
         s3_actions = self.permissions_db.get_service_actions("s3")
@@ -161,3 +168,37 @@ class TestIAMPermissionsDatabase:
         list_bucket_perms = [perm for perm in permissions if perm["action"] == "s3:ListBucket"]
         if list_bucket_perms:
             assert "arn:aws:s3:::" in list_bucket_perms[0]["resource"]
+    
+    def test_custom_permission_is_instance_local(self):
+        """Test that custom permissions do not leak into other instances."""
+        self.permissions_db.add_custom_permission(CommandPermissions(
+            service="s3",
+            action="custom-action",
+            permissions=[IAMPermission(action="s3:CustomAction")]
+        ))
+        
+        assert self.permissions_db.get_permissions("s3", "custom-action")
+        
+        other_db = IAMPermissionsDatabase()
+        assert other_db.get_permissions("s3", "custom-action") == []
+        assert other_db.get_permissions("s3", "ls") == self.permissions_db.get_permissions("s3", "ls")
+    
+    def test_load_permissions_file(self, tmp_path):
+        """Test merging a JSON database written by the documentation scraper."""
+        from iam_generator.doc_scraper import AWSCLIDocumentationScraper
+        
+        scraper = AWSCLIDocumentationScraper()
+        database = {
+            "newservice": {"list-things": scraper.map_command_to_permissions("newservice", "list-things")},
+            "s3": {"custom-action": scraper.map_command_to_permissions("s3", "custom-action")},
+        }
+        db_file = tmp_path / "extra.json"
+        scraper.save_database_to_json(database, str(db_file))
+        
+        self.permissions_db.load_permissions_file(db_file)
+        
+        assert "newservice" in self.permissions_db.get_supported_services()
+        assert self.permissions_db.get_permissions_object("newservice", "list-things") == database["newservice"]["list-things"]
+        assert self.permissions_db.get_permissions_object("s3", "custom-action") == database["s3"]["custom-action"]
+        # Existing entries for the service are kept
+        assert self.permissions_db.get_permissions("s3", "ls")
@@ -157,7 +157,20 @@ class TestIAMRoleGenerator:
         assert "aws iam create-role" in cli_content
         assert "aws iam create-policy" in cli_content
         assert "aws iam attach-role-policy" in cli_content
-    
+
+    def test_aws_cli_output_is_single_script(self, sample_analysis_result):
+        """Test that AWS CLI output is emitted as one shell script string."""
+        result = self.role_generator.generate_role(
+            analysis_result=sample_analysis_result,
+            role_name="ScriptRole"
+        )
+
+        cli_script = result["aws_cli"]
+        assert isinstance(cli_script, str)
+        assert cli_script.startswith("# Create IAM role ScriptRole")
+        assert '"s3:ListBucket"' in cli_script
+        assert cli_script.endswith("rm trust-policy.json permissions-policy.json")
+
     def test_complex_permissions_policy(self):
         """Test generation with complex permissions policy."""
         complex_analysis = {
@@ -359,3 +372,75 @@ class TestIAMRoleGenerator:
         permissions_policy = role_result["json"]["permissions_policy"]
         statement = permissions_policy["Statement"][0]
         assert "s3:ListBucket" in statement["Action"]
+
+    def test_role_cache_disabled_by_default(self, sample_analysis_result):
+        """Test that repeated calls build fresh results unless caching is enabled."""
+        first = self.role_generator.generate_role(
+            analysis_result=sample_analysis_result,
+            role_name="UncachedRole"
+        )
+        second = self.role_generator.generate_role(
+            analysis_result=sample_analysis_result,
+            role_name="UncachedRole"
+        )
+
+        assert first == second
+        assert first is not second
+
+    def test_role_cache_returns_memoized_result(self, sample_analysis_result):
+        """Test that identical inputs hit the cache when enabled."""
+        generator = IAMRoleGenerator(enable_cache=True)
+
+        first = generator.generate_role(
+            analysis_result=sample_analysis_result,
+            role_name="CachedRole"
+        )
+        second = generator.generate_role(
+            analysis_result=sample_analysis_result,
+            role_name="CachedRole"
+        )
+        other = generator.generate_role(
+            analysis_result=sample_analysis_result,
+            role_name="CachedRole",
+            trust_policy_type="ec2"
+        )
+
+        assert first is second
+        assert other is not first
+
+    def test_role_cache_evicts_least_recently_used(self, sample_analysis_result):
+        """Test that the role cache is bounded."""
+        generator = IAMRoleGenerator(enable_cache=True, cache_size=2)
+
+        first = generator.generate_role(analysis_result=sample_analysis_result, role_name="RoleA")
+        generator.generate_role(analysis_result=sample_analysis_result, role_name="RoleB")
+        generator.generate_role(analysis_result=sample_analysis_result, role_name="RoleC")
+
+        again = generator.generate_role(analysis_result=sample_analysis_result, role_name="RoleA")
+        assert again is not first
+        assert again == first
+
+    def test_role_cache_commands_use_one_entry(self):
+        """Test that generating from commands caches the result only once."""
+        generator = IAMRoleGenerator(enable_cache=True)
+
+        first = generator.generate_role(commands=["aws s3 ls s3://bucket"], role_name="CmdRole")
+        again = generator.generate_role(commands=["aws s3 ls s3://bucket"], role_name="CmdRole")
+
+        assert again is first
+        assert len(generator._cache) == 1
+
+    def test_generators_share_analyzer(self):
+        """Test that generator instances reuse one analyzer."""
+        assert IAMRoleGenerator().analyzer is self.role_generator.analyzer
+
+    def test_cloudformation_text_matches_template_dict(self, sample_analysis_result):
+        """Test that the CloudFormation text emitter matches the dict emitter."""
+        result = self.role_generator.generate_role(
+            analysis_result=sample_analysis_result,
+            role_name="TextRole",
+            description='Role with "quotes"'
+        )
+
+        cf_text = self.role_generator._generate_cloudformation_text(result)
+        assert cf_text == json.dumps(result["cloudformation"], indent=2)